@@ -0,0 +1,266 @@
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import combinations
+
+import records_store
+import set_engine
+import utils
+from game_core import Game
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(ROOT, "benchmark_baseline.json")
+BOARD_SIZES = [12, 15, 18, 21]
+RECORD_SIZES = [10, 10_000, 1_000_000]
+
+
+# ✅ 예전 pages/2_Game.py의 문자열 파싱 방식 (비교 기준)
+def legacy_is_set(cards):
+    attrs = [[int(ch) for ch in c[:4]] for c in cards]
+    for i in range(4):
+        if len({attr[i] for attr in attrs}) == 2:
+            return False
+    return True
+
+
+def legacy_any_set_exists(card_list):
+    return any(legacy_is_set(combo) for combo in combinations(card_list, 3))
+
+
+# ✅ 측정 도우미: 케이스마다 min_time을 넘는 반복 횟수를 정한 뒤, 모든 케이스를 번갈아 rounds번 측정
+# 한 케이스를 연달아 재지 않으므로 기계 부하 변화가 특정 케이스에만 몰리지 않는다. 값은 호출 1회당 ms.
+def _calibrate(fn, min_time):
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - t0 >= min_time or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def run_cases(cases, rounds=15, min_time=0.05):
+    numbers = {name: _calibrate(fn, min_time) for name, fn in cases.items()}
+    samples = {name: [] for name in cases}
+    for _ in range(rounds):
+        for name, fn in cases.items():
+            number = numbers[name]
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples[name].append((time.perf_counter() - t0) / number * 1000)
+    return {
+        name: {"median_ms": statistics.median(v), "min_ms": min(v), "calls": numbers[name] * rounds}
+        for name, v in samples.items()
+    }
+
+
+# ✅ 보드 생성: SET이 있는 무작위 보드 / SET이 없는 최악 보드
+def random_board(rng, k):
+    return rng.sample(range(set_engine.N_CARDS), k)
+
+
+def no_set_board(rng, k):
+    while True:
+        board = []
+        deck = list(range(set_engine.N_CARDS))
+        rng.shuffle(deck)
+        for c in deck:
+            if all(set_engine.third_card(a, c) not in board for a in board):
+                board.append(c)
+                if len(board) == k:
+                    return board
+
+
+def bench_engine(rng, cases):
+    for k in BOARD_SIZES:
+        boards = {"random": random_board(rng, k)}
+        # 21장 이상은 항상 SET이 존재한다
+        if k <= 20:
+            boards["no_set"] = no_set_board(rng, k)
+        for kind, board in boards.items():
+            names = [set_engine.card_name(c) for c in board]
+            triple = names[:3]
+            cases[f"engine.has_set[{k},{kind}]"] = lambda board=board: set_engine.has_set(board)
+            cases[f"engine.count_sets[{k},{kind}]"] = lambda board=board: set_engine.count_sets(board)
+            cases[f"utils.is_set[{k},{kind}]"] = lambda triple=triple: utils.is_set(*triple)
+            cases[f"legacy.any_set_exists[{k},{kind}]"] = lambda names=names: legacy_any_set_exists(names)
+            cases[f"legacy.is_set[{k},{kind}]"] = lambda triple=triple: legacy_is_set(triple)
+
+
+# ✅ 변형 덱(5~6속성)의 큰 보드: 테이블 없이 27값 단위로 세 번째 카드 계산
+def bench_variants(rng, cases):
+    for key in ("five", "six"):
+        variant = set_engine.VARIANTS[key]
+        for k in (variant.board_size, variant.max_board):
+            board = rng.sample(variant.cards, k)
+            cases[f"variant.has_set[{key},{k}]"] = lambda v=variant, board=board: v.has_set(board)
+            cases[f"variant.count_sets[{key},{k}]"] = lambda v=variant, board=board: v.count_sets(board)
+            cases[f"variant.board_build[{key},{k}]"] = lambda v=variant, board=board: set_engine.Board(board, v)
+
+
+def bench_hint(rng, cases):
+    game = Game(seed=rng.random(), clock=lambda: 0)
+    game.start()
+
+    def hint():
+        game.selected = []
+        game.hint()
+
+    cases["game.hint[12]"] = hint
+
+
+def _fake_records(rng, n):
+    success = [(i + 1, str(timedelta(seconds=10 * i)), rng.choice(["", "힌트 사용"])) for i in range(n)]
+    fail = [(i + 1, str(timedelta(seconds=15 * i))) for i in range(n // 3)]
+    return success, fail
+
+
+def bench_save(rng, cases, workdir):
+    success, fail = _fake_records(rng, 20)
+    stores = {
+        "csv": records_store.CSVRecordsStore(os.path.join(workdir, "save_bench.csv")),
+        "sqlite": records_store.SQLiteRecordsStore(os.path.join(workdir, "save_bench.db"), migrate_from=False),
+    }
+    for backend, store in stores.items():
+        cases[f"utils.save_stats_summary[{backend}]"] = (
+            lambda store=store: utils.save_stats_summary(success, fail, 300, store=store)
+        )
+
+
+def write_records(path, n, rng):
+    start = datetime(2025, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for i in range(n):
+            ok = rng.randint(0, 25)
+            hint = rng.randint(0, 5)
+            fail = rng.randint(0, 8)
+            writer.writerow([
+                (start + timedelta(minutes=7 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+                ok, round(rng.uniform(5, 60), 2), hint, ok + hint, fail,
+                round(rng.uniform(5, 60), 2), ok - fail, rng.randint(60, 900),
+            ])
+
+
+# ✅ pages/Records.py 전체 실행 (기록 로드 + DataFrame + 차트) 시간
+# 크기마다 새 프로세스에서 재고, 매번 프로세스 전역 캐시(차트/요약)를 비워 앞선 실행의 캐시를 쓰지 않게 한다
+def _records_page_child(page, workdir, db_path, repeat):
+    from streamlit.testing.v1 import AppTest
+    import records_charts
+    import records_tail
+
+    os.chdir(workdir)
+    os.environ["SET_RECORDS_PATH"] = db_path
+    samples = []
+    for _ in range(repeat):
+        records_charts._cache.clear()
+        records_tail._tails.clear()
+        at = AppTest.from_file(page, default_timeout=600)
+        t0 = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return samples
+
+
+def bench_records_page(rng, results, workdir, sizes):
+    os.symlink(os.path.join(ROOT, "fonts"), os.path.join(workdir, "fonts"))
+    page = os.path.join(ROOT, "pages", "Records.py")
+    context = multiprocessing.get_context("spawn")
+    for n in sizes:
+        # 크기별로 새 DB를 만들어 CSV를 한 번에 가져온다
+        csv_path = os.path.join(workdir, f"records_{n}.csv")
+        write_records(csv_path, n, rng)
+        db_path = os.path.join(workdir, f"records_{n}.db")
+        records_store.SQLiteRecordsStore(db_path, migrate_from=csv_path)
+        with context.Pool(1) as pool:
+            samples = pool.apply(_records_page_child, (page, workdir, db_path, 3 if n < 1_000_000 else 2))
+        results[f"records_page[{n}]"] = {
+            "median_ms": statistics.median(samples), "min_ms": min(samples), "calls": len(samples),
+        }
+
+
+# ✅ 기준값과 비교: 최솟값(가장 방해 없이 잰 값)이 threshold 배 넘게 느려지면 회귀
+def compare(results, baseline, threshold):
+    report = {}
+    for name, cur in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            # 기준값이 없는 케이스(새로 추가했거나 이름을 바꾼 경우)도 실패로 보고한다
+            report[name] = {"baseline_ms": None, "ratio": None, "regressed": False, "missing": True}
+            continue
+        ratio = cur["min_ms"] / base["min_ms"] if base["min_ms"] else float("inf")
+        report[name] = {"baseline_ms": base["min_ms"], "ratio": round(ratio, 3), "regressed": ratio > threshold}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 게임 핫패스 / 기록 파이프라인 벤치마크")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--threshold", type=float, default=1.5, help="회귀로 볼 속도 저하 배수 (최솟값 기준)")
+    parser.add_argument("--quick", action="store_true", help="100만 행 기록 측정 생략")
+    parser.add_argument("--skip-records", action="store_true", help="Records 페이지 측정 생략")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=15, help="케이스를 번갈아 측정하는 횟수")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cases = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        bench_engine(rng, cases)
+        bench_variants(rng, cases)
+        bench_hint(rng, cases)
+        bench_save(rng, cases, workdir)
+        results = run_cases(cases, rounds=args.rounds)
+        if not args.skip_records:
+            sizes = RECORD_SIZES[:-1] if args.quick else RECORD_SIZES
+            bench_records_page(rng, results, workdir, sizes)
+
+    output = {
+        "meta": {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            output["comparison"] = compare(results, json.load(f), args.threshold)
+
+    text = json.dumps(output, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    comparison = output.get("comparison", {})
+    regressed = [name for name, c in comparison.items() if c["regressed"]]
+    missing = [name for name, c in comparison.items() if c.get("missing")]
+    for name in regressed:
+        print(f"❌ 회귀: {name} ({comparison[name]['ratio']}x)", file=sys.stderr)
+    for name in missing:
+        print(f"❌ 기준값 없음: {name} (--save-baseline으로 기준을 다시 저장하세요)", file=sys.stderr)
+    return 1 if regressed or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+import card_art
+import card_cache
+import set_engine
+
+# ✅ 보드 합성 이미지 설정 (게임 페이지와 같은 4열 배치)
+COLUMNS = 4
+CARD_WIDTH = 160
+GAP = 14
+BORDER = 6
+SELECT_COLOR = (255, 75, 75, 255)
+OUTLINE_COLOR = (220, 220, 220, 255)
+LABEL_COLOR = (90, 90, 90, 255)
+BACKGROUND = (255, 255, 255, 0)
+MAX_BOARDS = 256
+
+FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "NanumGothic-Regular.ttf")
+
+_lock = threading.Lock()
+_tiles = {}
+_boards = OrderedDict()
+_font = None
+
+
+# 카드 캐시가 다시 로드된 뒤 (카드 캐시 잠금 밖에서) 호출된다
+def _clear():
+    with _lock:
+        _tiles.clear()
+        _boards.clear()
+
+
+card_cache.on_invalidate(_clear)
+
+
+def _tile(name):
+    with _lock:
+        tile = _tiles.get(name)
+    if tile is None:
+        tile = Image.open(io.BytesIO(card_art.card_image(name, CARD_WIDTH))).convert("RGBA")
+        with _lock:
+            tile = _tiles.setdefault(name, tile)
+    return tile
+
+
+def _label_font():
+    global _font
+    if _font is None:
+        _font = ImageFont.truetype(FONT_PATH, 18)
+    return _font
+
+
+def cell_size():
+    tile = _tile(set_engine.card_name(0))
+    return tile.width + GAP, tile.height + GAP
+
+
+def image_size(n_cards):
+    cw, ch = cell_size()
+    rows = (n_cards + COLUMNS - 1) // COLUMNS
+    return COLUMNS * cw + GAP, rows * ch + GAP
+
+
+# ✅ 클릭 좌표 → 카드 위치 (카드 밖이면 None)
+def position_at(x, y, n_cards, scale=1.0):
+    cw, ch = cell_size()
+    x, y = x / scale - GAP, y / scale - GAP
+    if x < 0 or y < 0:
+        return None
+    col, row = int(x // cw), int(y // ch)
+    if col >= COLUMNS or x - col * cw > cw - GAP or y - row * ch > ch - GAP:
+        return None
+    idx = row * COLUMNS + col
+    return idx if idx < n_cards else None
+
+
+def _compose(names, selected):
+    cw, ch = cell_size()
+    board = Image.new("RGBA", image_size(len(names)), BACKGROUND)
+    draw = ImageDraw.Draw(board)
+    for idx, name in enumerate(names):
+        tile = _tile(name)
+        x = GAP + (idx % COLUMNS) * cw
+        y = GAP + (idx // COLUMNS) * ch
+        board.alpha_composite(tile, (x, y))
+        box = (x - BORDER // 2, y - BORDER // 2, x + tile.width + BORDER // 2, y + tile.height + BORDER // 2)
+        if idx in selected:
+            draw.rounded_rectangle(box, radius=10, outline=SELECT_COLOR, width=BORDER)
+        else:
+            draw.rounded_rectangle(box, radius=10, outline=OUTLINE_COLOR, width=2)
+        draw.text((x + 8, y + 4), str(idx + 1), fill=LABEL_COLOR, font=_label_font())
+    buf = io.BytesIO()
+    board.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# ✅ 이미 인코딩된 PNG를 save()로 그대로 내보내는 래퍼 (재인코딩 없이 이미지 컴포넌트에 전달)
+class EncodedImage:
+    def __init__(self, data):
+        self.data = data
+
+    def save(self, fp, format=None, **params):
+        fp.write(self.data)
+
+
+# ✅ 보드 상태(카드 + 선택 위치)별로 합성 이미지를 메모이즈
+# 잠금은 캐시 조회/저장에만 쓰고, 합성은 잠금 밖에서 해 다른 세션의 보드 렌더링을 막지 않는다
+def render_board(names, selected=()):
+    key = (tuple(names), frozenset(selected))
+    with _lock:
+        data = _boards.get(key)
+        if data is not None:
+            _boards.move_to_end(key)
+            return data
+    data = _compose(key[0], key[1])
+    with _lock:
+        _boards[key] = data
+        while len(_boards) > MAX_BOARDS:
+            _boards.popitem(last=False)
+    return data
@@ -0,0 +1,139 @@
+import functools
+import io
+import math
+import os
+
+from PIL import Image, ImageChops, ImageDraw
+
+import card_cache
+
+# ✅ 절차 생성 카드: 속성 숫자만으로 카드 앞면을 그린다 (원본 카드와 같은 167×258 비율)
+# 자리 순서는 파일명과 같다: 명암, 모양, 색깔, 개수, (배경), (테두리)
+BASE_WIDTH = 167
+BASE_HEIGHT = 258
+SUPERSAMPLE = 2
+MAX_IMAGES = 2048
+
+COLORS = [(234, 28, 45), (97, 51, 148), (0, 169, 80)]
+BACKGROUNDS = [(255, 255, 255), (255, 244, 204), (222, 238, 255)]
+OUTLINE = (200, 200, 200)
+
+
+# 모양 한 개의 다각형 (중심 cx, cy / 너비 w, 높이 h)
+def _shape_points(shape, cx, cy, w, h):
+    if shape == 1:  # 마름모
+        return [(cx - w / 2, cy), (cx, cy - h / 2), (cx + w / 2, cy), (cx, cy + h / 2)]
+    if shape == 2:  # 타원 (양 끝이 둥근 캡슐)
+        r = h / 2
+        points = []
+        for i in range(17):
+            t = math.pi * (0.5 + i / 16)
+            points.append((cx - w / 2 + r + r * math.cos(t), cy - r * math.sin(t)))
+        for i in range(17):
+            t = math.pi * (-0.5 + i / 16)
+            points.append((cx + w / 2 - r + r * math.cos(t), cy - r * math.sin(t)))
+        return points
+    # 물결: 위아래 가장자리를 사인 곡선으로
+    top, bottom = [], []
+    for i in range(25):
+        x = cx - w / 2 + w * i / 24
+        wave = h * 0.22 * math.sin(2 * math.pi * i / 24)
+        top.append((x, cy - h / 2 + h * 0.22 + wave))
+        bottom.append((x, cy + h / 2 - h * 0.22 + wave))
+    return top + bottom[::-1]
+
+
+def _draw_symbol(card, attrs, cx, cy, w, h, scale):
+    shading, shape, color = attrs[0], attrs[1], COLORS[attrs[2]]
+    points = _shape_points(shape, cx, cy, w, h)
+    line = 3 * scale
+    if shading == 0:
+        ImageDraw.Draw(card).polygon(points, fill=color)
+        return
+    if shading == 1:
+        # 줄무늬: 세로줄 이미지를 모양 마스크로 잘라 붙인다 (모양이 있는 영역만)
+        box = (int(cx - w / 2), int(cy - h / 2), int(cx + w / 2) + 1, int(cy + h / 2) + 1)
+        mask = Image.new("L", (box[2] - box[0], box[3] - box[1]), 0)
+        ImageDraw.Draw(mask).polygon([(x - box[0], y - box[1]) for x, y in points], fill=255)
+        stripes = _stripes(card.size, scale).crop(box)
+        card.paste(color, box, mask=ImageChops.multiply(mask, stripes))
+    ImageDraw.Draw(card).polygon(points, outline=color, width=line)
+
+
+@functools.lru_cache(maxsize=4)
+def _stripes(size, scale):
+    stripes = Image.new("L", size, 0)
+    draw = ImageDraw.Draw(stripes)
+    for x in range(0, size[0], 5 * scale):
+        draw.line([(x, 0), (x, size[1])], fill=255, width=scale)
+    return stripes
+
+
+def _draw_border(card, style, scale):
+    draw = ImageDraw.Draw(card)
+    w, h = card.size
+    inset = 4 * scale
+    box = (inset, inset, w - inset - 1, h - inset - 1)
+    if style == 0:
+        draw.rounded_rectangle(box, radius=10 * scale, outline=OUTLINE, width=2 * scale)
+    elif style == 1:
+        # 점선
+        x0, y0, x1, y1 = box
+        step = 10 * scale
+        for x in range(x0, x1, step):
+            draw.line([(x, y0), (x + step // 2, y0)], fill=(90, 90, 90), width=2 * scale)
+            draw.line([(x, y1), (x + step // 2, y1)], fill=(90, 90, 90), width=2 * scale)
+        for y in range(y0, y1, step):
+            draw.line([(x0, y), (x0, y + step // 2)], fill=(90, 90, 90), width=2 * scale)
+            draw.line([(x1, y), (x1, y + step // 2)], fill=(90, 90, 90), width=2 * scale)
+    else:
+        # 이중선
+        draw.rounded_rectangle(box, radius=10 * scale, outline=(90, 90, 90), width=2 * scale)
+        inner = tuple(v + d for v, d in zip(box, (5 * scale, 5 * scale, -5 * scale, -5 * scale)))
+        draw.rounded_rectangle(inner, radius=8 * scale, outline=(90, 90, 90), width=2 * scale)
+
+
+# ✅ 속성 리스트 → 원본 해상도의 SUPERSAMPLE배 카드 이미지 (RGB)
+def draw_full(attrs):
+    scale = SUPERSAMPLE
+    w, h = BASE_WIDTH * scale, BASE_HEIGHT * scale
+    background = BACKGROUNDS[attrs[4]] if len(attrs) > 4 else BACKGROUNDS[0]
+    card = Image.new("RGB", (w, h), background)
+    if len(attrs) > 5:
+        _draw_border(card, attrs[5], scale)
+    count = attrs[3] + 1
+    sw, sh = w * 0.7, h * 0.2
+    pitch = h * 0.27
+    for i in range(count):
+        cy = h / 2 + (i - (count - 1) / 2) * pitch
+        _draw_symbol(card, attrs, w / 2, cy, sw, sh, scale)
+    return card
+
+
+def resize(card, width):
+    return card.resize((width, round(BASE_HEIGHT * width / BASE_WIDTH)), Image.LANCZOS)
+
+
+# ✅ 속성 리스트 → 카드 이미지 (RGB, 너비 width)
+def draw_card(attrs, width=BASE_WIDTH):
+    return resize(draw_full(attrs), width)
+
+
+@functools.lru_cache(maxsize=MAX_IMAGES)
+def render_png(digits, width):
+    buf = io.BytesIO()
+    draw_card([int(d) for d in digits], width).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# ✅ 카드 파일명 → PNG 바이트
+# set_cards/에 있는 4속성 카드는 파일 캐시를, 그 밖의 카드(5~6속성)는 절차 생성 캐시를 쓴다.
+def card_image(name, width):
+    digits = os.path.splitext(name)[0]
+    if len(digits) == 4 and card_cache.has(name):
+        return card_cache.card_image(name, width)
+    return render_png(digits, width)
+
+
+def card_images(names, width):
+    return [card_image(name, width) for name in names]
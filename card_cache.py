@@ -0,0 +1,194 @@
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from PIL import Image
+
+import set_engine
+
+# ✅ 카드 이미지 경로 / 페이지에서 쓰는 너비 (utils 120, 튜토리얼 130, 게임 160)
+CARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "set_cards")
+WIDTHS = (120, 130, 160)
+MAX_ENTRIES = set_engine.N_CARDS * len(WIDTHS)
+CHECK_INTERVAL = 2.0
+
+
+def _encode_png(im, width):
+    if im.width != width:
+        im = im.resize((width, round(im.height * width / im.width)), Image.LANCZOS)
+    buf = io.BytesIO()
+    im.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# ✅ 프로세스 전체(모든 세션)가 공유하는 카드 이미지 캐시
+class CardImageCache:
+    def __init__(self, card_dir=CARD_DIR, widths=WIDTHS, max_entries=MAX_ENTRIES, check_interval=CHECK_INTERVAL):
+        self.card_dir = card_dir
+        self.widths = tuple(widths)
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._originals = {}
+        self._encoded = OrderedDict()
+        self._signature = None
+        self._names = None
+        self._checked_at = 0.0
+        self._loading = False
+        self._thread = None
+        self._listeners = []
+
+    # 디렉토리 서명: (파일명, 크기, 수정 시각) 목록
+    def _scan(self):
+        with os.scandir(self.card_dir) as it:
+            return tuple(sorted(
+                (e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in it if e.name.endswith(".png")
+            ))
+
+    # 디스크에서 읽고 너비별로 인코딩 (잠금 없이 실행 가능)
+    def _build(self):
+        signature = self._scan()
+        originals = {}
+        for name, _, _ in signature:
+            with Image.open(os.path.join(self.card_dir, name)) as im:
+                im.load()
+                originals[name] = im
+        encoded = OrderedDict(
+            ((name, width), _encode_png(im, width)) for width in self.widths for name, im in originals.items()
+        )
+        return signature, originals, encoded
+
+    def _install(self, signature, originals, encoded):
+        self._signature = signature
+        self._names = frozenset(name for name, _, _ in signature)
+        self._checked_at = time.monotonic()
+        self._originals = originals
+        self._encoded = encoded
+        while len(self._encoded) > self.max_entries:
+            self._encoded.popitem(last=False)
+
+    def _remember(self, key, data):
+        self._encoded[key] = data
+        while len(self._encoded) > self.max_entries:
+            self._encoded.popitem(last=False)
+
+    # 백그라운드 로드: 읽기/인코딩은 잠금 밖에서, 교체만 잠금 안에서, 리스너는 잠금을 푼 뒤 호출
+    def _reload(self):
+        loaded = None
+        try:
+            loaded = self._build()
+        finally:
+            with self._lock:
+                self._loading = False
+                if loaded is not None:
+                    self._install(*loaded)
+                listeners = list(self._listeners) if loaded is not None else []
+        for listener in listeners:
+            listener()
+
+    # 잠금 안에서 호출: 로드 중이 아니면 로드 스레드 시작
+    def _start_load_locked(self):
+        if self._loading or not os.path.isdir(self.card_dir):
+            return
+        self._loading = True
+        self._thread = threading.Thread(target=self._reload, name="card-preload", daemon=True)
+        self._thread.start()
+
+    # CHECK_INTERVAL마다 디렉토리 서명 확인 (스캔은 잠금 밖), 처음이거나 바뀌었으면 백그라운드에서 다시 로드
+    def _check(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._loading or (self._signature is not None and now - self._checked_at < self.check_interval):
+                return
+            self._checked_at = now
+            signature = self._signature
+            if signature is None:
+                self._start_load_locked()
+                return
+        if self._scan() != signature:
+            with self._lock:
+                self._start_load_locked()
+
+    # ✅ 카드 한 장의 PNG 바이트 (너비별로 미리 리사이즈/인코딩)
+    # 첫 요청이 백그라운드 로드를 시작하고, 로드가 끝나기 전에는 기다리지 않고 그 카드만 디스크에서 인코딩한다
+    def get(self, name, width):
+        self._check()
+        key = (name, width)
+        with self._lock:
+            if self._signature is not None:
+                data = self._encoded.get(key)
+                if data is not None:
+                    self._encoded.move_to_end(key)
+                    return data
+                im = self._originals[name]
+            else:
+                im = None
+        if im is not None:
+            data = _encode_png(im, width)
+            with self._lock:
+                self._remember(key, data)
+            return data
+        with Image.open(os.path.join(self.card_dir, name)) as im:
+            return _encode_png(im, width)
+
+    def get_many(self, names, width):
+        return [self.get(name, width) for name in names]
+
+    # ✅ 이 카드 파일이 있는지 (메모리의 파일 목록으로 판단, 로드 전에는 디렉토리를 한 번만 읽는다)
+    def has(self, name):
+        self._check()
+        names = self._names
+        if names is None:
+            with self._lock:
+                if self._names is None:
+                    self._names = frozenset(
+                        n for n, _, _ in (self._scan() if os.path.isdir(self.card_dir) else ())
+                    )
+                names = self._names
+        return name in names
+
+    # 전체 로드가 끝날 때까지 기다린다 (이미 로드돼 있으면 바로 반환)
+    def preload(self):
+        with self._lock:
+            if self._signature is None:
+                self._start_load_locked()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    # ✅ 무효화 훅: 카드 파일을 바꾼 뒤 호출하면 다음 요청 때 백그라운드에서 다시 로드
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+
+    def on_invalidate(self, listener):
+        self._listeners.append(listener)
+
+
+_cache = CardImageCache()
+
+
+def card_image(name, width):
+    return _cache.get(name, width)
+
+
+def card_images(names, width):
+    return _cache.get_many(names, width)
+
+
+def has(name):
+    return _cache.has(name)
+
+
+def preload():
+    _cache.preload()
+
+
+def invalidate():
+    _cache.invalidate()
+
+
+def on_invalidate(listener):
+    _cache.on_invalidate(listener)
@@ -0,0 +1,151 @@
+import argparse
+import os
+import random
+import struct
+import time
+from collections import Counter, namedtuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ✅ 한 수 단위 이벤트 로그 (고정 길이 바이너리, 덧붙이기 전용)
+# 레코드 하나 = 20바이트: 단조 시각(float64), 세션 번호(uint32), 종류(uint16), 카드 3장(uint16, 없으면 NONE)
+EVENTS_PATH = os.environ.get("SET_EVENTS_PATH", "game_events.bin")
+RECORD = struct.Struct("<dIH3H")
+NONE = 0xFFFF
+BATCH = 64
+READ_CHUNK = 4096
+
+START, END, DEAL, ADD3, SELECT, DESELECT, HINT, SUBMIT_OK, SUBMIT_FAIL = range(9)
+KINDS = ["start", "end", "deal", "add3", "select", "deselect", "hint", "submit_ok", "submit_fail"]
+
+Event = namedtuple("Event", ["ts", "session", "kind", "cards"])
+
+
+# ✅ 세션 하나의 기록기: 메모리 버퍼에 모았다가 BATCH개마다(그리고 게임 종료 때) 한 번에 쓴다
+class EventWriter:
+    def __init__(self, path=None, session=None, clock=time.monotonic, batch=BATCH):
+        self.path = path or EVENTS_PATH
+        self.session = random.getrandbits(32) if session is None else session
+        self.clock = clock
+        self.batch = batch
+        self._buffer = bytearray()
+        self._pending = 0
+
+    def log(self, kind, cards=()):
+        c = list(cards)[:3]
+        c += [NONE] * (3 - len(c))
+        self._buffer += RECORD.pack(self.clock(), self.session, kind, *c)
+        self._pending += 1
+        if self._pending >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, self._buffer)
+        finally:
+            os.close(fd)
+        self._buffer.clear()
+        self._pending = 0
+
+
+# ✅ 스트리밍 읽기: 파일 전체를 올리지 않고 READ_CHUNK개씩 읽는다 (끝에 잘린 레코드는 무시)
+def iter_records(path=None):
+    path = path or EVENTS_PATH
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(RECORD.size * READ_CHUNK)
+            usable = len(chunk) - len(chunk) % RECORD.size
+            yield from RECORD.iter_unpack(chunk[:usable])
+            if len(chunk) < RECORD.size * READ_CHUNK:
+                return
+
+
+def iter_events(path=None, session=None):
+    for ts, sid, kind, a, b, c in iter_records(path):
+        if session is None or sid == session:
+            yield Event(ts, sid, kind, tuple(x for x in (a, b, c) if x != NONE))
+
+
+# ✅ 다시 보기: 세션의 이벤트마다 그 시점의 보드(카드 id 목록)를 함께 돌려준다
+# SET 성공 직후의 deal은 게임과 같이 빠진 자리에 채우고, 그렇지 않으면 빠진 자리를 지운다.
+def replay(session, path=None):
+    board, holes = [], []
+    for event in iter_events(path, session):
+        if holes and event.kind != DEAL:
+            for pos in reversed(holes):
+                board.pop(pos)
+            holes = []
+        if event.kind == START:
+            board = []
+        elif event.kind in (DEAL, ADD3):
+            if holes:
+                for pos, card in zip(holes, event.cards):
+                    board[pos] = card
+                holes = []
+            else:
+                board.extend(event.cards)
+        elif event.kind == SUBMIT_OK:
+            holes = sorted(board.index(c) for c in event.cards)
+        yield event, list(board)
+
+
+# ✅ 집계: 종류별 개수, 세션/게임 수, SET을 찾기까지 걸린 시간(직전 성공 또는 게임 시작부터)
+def aggregate(path=None):
+    kinds = Counter()
+    sessions = set()
+    since = {}
+    find_total, find_count, find_max = 0.0, 0, 0.0
+    for ts, sid, kind, *_ in iter_records(path):
+        kinds[kind] += 1
+        sessions.add(sid)
+        if kind == START:
+            since[sid] = ts
+        elif kind == SUBMIT_OK and sid in since:
+            gap = ts - since[sid]
+            find_total += gap
+            find_count += 1
+            find_max = max(find_max, gap)
+            since[sid] = ts
+        elif kind == END:
+            since.pop(sid, None)
+    return {
+        "events": sum(kinds.values()),
+        "sessions": len(sessions),
+        "games": kinds[START],
+        "by_kind": {KINDS[k]: n for k, n in sorted(kinds.items())},
+        "avg_find_sec": find_total / find_count if find_count else 0.0,
+        "max_find_sec": find_max,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 이벤트 로그 집계 / 다시 보기")
+    parser.add_argument("path", nargs="?", default=None)
+    parser.add_argument("--replay", type=int, default=None, help="이 세션 번호의 이벤트를 보드와 함께 출력")
+    args = parser.parse_args(argv)
+
+    if args.replay is not None:
+        for event, board in replay(args.replay, args.path):
+            print(f"{event.ts:12.3f} {KINDS[event.kind]:<12} {list(event.cards)!s:<16} 보드 {len(board)}장")
+        return
+    t0 = time.perf_counter()
+    stats = aggregate(args.path)
+    print(f"📼 이벤트 {stats['events']:,}개 · 세션 {stats['sessions']:,}개 · 게임 {stats['games']:,}판 "
+          f"({time.perf_counter() - t0:.2f}초)")
+    for kind, n in stats["by_kind"].items():
+        print(f"  {kind:<12} {n:,}")
+    print(f"  SET 찾기 평균 {stats['avg_find_sec']:.2f}초, 최대 {stats['max_find_sec']:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
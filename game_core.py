@@ -0,0 +1,362 @@
+import argparse
+import random
+import sys
+import threading
+import time
+from array import array
+from collections import namedtuple
+from itertools import permutations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import event_log
+import set_engine
+
+BOARD_SIZE = 12
+HINT_NOTE = "힌트 사용"
+HINT_PAIRS = tuple(permutations(range(3), 2))
+_MASK64 = (1 << 64) - 1
+
+
+# ✅ 정수 섞기 (splitmix64): 힌트마다 Random 객체를 만들지 않고 재현 가능한 값을 얻는다
+def _mix(*values):
+    h = 0x9E3779B97F4A7C15
+    for v in values:
+        h = ((h ^ v) * 0xBF58476D1CE4E5B9) & _MASK64
+        h ^= h >> 31
+    return h
+
+
+# ✅ 덱: 미리 섞어 둔 카드 순열(array('B'), 256장 넘는 변형 덱은 'H')과 뽑기 포인터 — 뽑기 O(1)
+class Deck:
+    __slots__ = ("order", "pos")
+
+    def __init__(self, rng=None, variant=None):
+        variant = variant or set_engine.STANDARD
+        self.order = array(variant.typecode, variant.cards)
+        if rng is not None:
+            rng.shuffle(self.order)
+        self.pos = 0
+
+    def remaining(self):
+        return len(self.order) - self.pos
+
+    def peek(self, n):
+        return self.order[self.pos:self.pos + n]
+
+    def draw(self, n):
+        drawn = self.peek(n)
+        self.pos += len(drawn)
+        return drawn
+
+
+# ✅ SET 성공 뒤 보드 미리 계산
+# 보드 위 SET마다 "교체(또는 제거) 후 보드, 그 보드의 SET 목록, SET이 없어 추가할 3장"을 미리 만들어 둔다.
+# 덱의 다음 카드는 순열에서 peek으로 알 수 있으므로 결과가 실제 진행과 똑같다.
+Outcome = namedtuple("Outcome", ["board", "drawn", "add3"])
+
+SPECULATE_WORKERS = 2
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=SPECULATE_WORKERS, thread_name_prefix="set-speculate")
+        return _pool
+
+
+def plan_outcomes(variant, cards, upcoming):
+    board = set_engine.Board(cards, variant)
+    outcomes = {}
+    for combo in board.sets:
+        nxt = board.copy()
+        indices = sorted(cards.index(c) for c in combo)
+        drawn = ()
+        if len(nxt) == variant.board_size and len(upcoming) >= 3:
+            drawn = upcoming[:3]
+            nxt.replace(indices, drawn)
+        else:
+            for idx in reversed(indices):
+                nxt.pop(idx)
+        add3 = []
+        pos = len(drawn)
+        while not nxt.has_set() and len(nxt) + 3 <= variant.max_board and len(upcoming) - pos >= 3:
+            add3.append(upcoming[pos:pos + 3])
+            nxt.extend(add3[-1])
+            pos += 3
+        outcomes[combo] = Outcome(nxt, drawn, add3)
+    return outcomes
+
+
+# ✅ Streamlit과 무관한 SET 게임 규칙 (시드 고정 가능)
+# 세션에는 시드, 덱 순열, 보드(array('B') + 비트마스크 + SET 목록)만 두고, 파일명은 화면에 그릴 때만 만든다
+class Game:
+    def __init__(self, seed=None, clock=time.time, variant="standard", events=None, speculate=False):
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.clock = clock
+        self.variant = set_engine.VARIANTS[variant]
+        self.events = events
+        self.speculate = speculate
+        self.games_played = 0
+        self.reset()
+
+    def reset(self):
+        self.started = False
+        self.board = set_engine.Board(variant=self.variant)
+        self.deck = Deck(variant=self.variant)
+        self.selected = []
+        self.set_success = []
+        self.set_fail = []
+        self.start_time = 0
+        self.hint_mode = False
+        self._hint_key = 0
+        self._future = None
+        self._future_key = None
+
+    # 판/동작별로 재현 가능한 난수 (세션에 Random 상태를 들고 있지 않는다)
+    def _rng(self, *tag):
+        return random.Random(":".join(map(str, (self.seed, self.games_played) + tag)))
+
+    # 보드가 바뀔 때마다 다음 결과를 백그라운드에서 계산해 둔다 (보드 + 덱 위치로 식별)
+    def _speculate(self):
+        if not self.speculate:
+            return
+        # 아직 시작하지 않은 이전 계산은 취소 (빠르게 진행할 때 오래된 작업이 쌓이지 않게)
+        if self._future is not None:
+            self._future.cancel()
+        self._future_key = (tuple(self.cards), self.deck.pos)
+        upcoming = tuple(self.deck.peek(3 + self.variant.max_board))
+        self._future = _executor().submit(plan_outcomes, self.variant, self._future_key[0], upcoming)
+
+    # 계산이 끝났고 지금 보드와 같은 상태일 때만 결과 사용 (기다리지 않는다)
+    def _ready_outcome(self, combo):
+        future = self._future
+        if future is None or not future.done() or self._future_key != (tuple(self.cards), self.deck.pos):
+            return None
+        return future.result().get(combo)
+
+    # 이벤트 로그가 연결돼 있을 때만 한 수 기록
+    def _log(self, kind, cards=()):
+        if self.events is not None:
+            self.events.log(kind, cards)
+
+    def elapsed(self):
+        if not self.started:
+            return 0
+        return int(self.clock() - self.start_time)
+
+    @property
+    def cards(self):
+        return self.board.cards
+
+    @property
+    def board_mask(self):
+        return self.board.mask
+
+    def card_names(self):
+        return [self.variant.card_name(c) for c in self.cards]
+
+    def on_board(self, card):
+        return card in self.board
+
+    @property
+    def board_size(self):
+        return self.variant.board_size
+
+    # ✅ 게임 시작: 12장 깔기 (변형 덱은 덱마다 정한 장수)
+    def start(self, variant=None):
+        if variant is not None:
+            self.variant = set_engine.VARIANTS[variant]
+        self.reset()
+        self.games_played += 1
+        self.started = True
+        self.start_time = self.clock()
+        self.deck = Deck(self._rng("deck"), self.variant)
+        self._hint_key = self._rng("hint").getrandbits(64)
+        self.board = set_engine.Board(self.deck.draw(self.board_size), self.variant)
+        self._log(event_log.START)
+        for i in range(0, len(self.cards), 3):
+            self._log(event_log.DEAL, self.cards[i:i + 3])
+        self._speculate()
+
+    # ✅ 카드 선택/해제 (최대 3장)
+    def select(self, idx):
+        if idx in self.selected:
+            self.selected.remove(idx)
+            self._log(event_log.DESELECT, (self.cards[idx],))
+        elif len(self.selected) < 3:
+            self.selected.append(idx)
+            self._log(event_log.SELECT, (self.cards[idx],))
+
+    # ✅ 힌트: SET 중 2장을 선택해 둠 (보드가 관리하는 SET 목록 사용)
+    def hint(self):
+        sets = self.board.find_sets()
+        if not sets:
+            return False
+        combo = sets[0]
+        a, b = HINT_PAIRS[_mix(self._hint_key, len(self.set_success), len(self.set_fail)) % len(HINT_PAIRS)]
+        self.selected = [combo[a], combo[b]]
+        self.hint_mode = True
+        self._log(event_log.HINT, [self.cards[i] for i in self.selected])
+        return True
+
+    # ✅ 선택한 3장 제출: SET이면 True, 아니면 False, 3장이 아니면 None
+    # 미리 계산한 결과가 있으면 교체와 3장 추가까지 한 번에 적용한다
+    def submit(self):
+        if len(self.selected) != 3:
+            return None
+        elapsed = str(timedelta(seconds=self.elapsed()))
+        ok = self.variant.is_set_ids(*(self.cards[i] for i in self.selected))
+        self._log(event_log.SUBMIT_OK if ok else event_log.SUBMIT_FAIL, [self.cards[i] for i in self.selected])
+        if ok:
+            note = HINT_NOTE if self.hint_mode else ""
+            self.set_success.append((len(self.set_success) + 1, elapsed, note))
+            selected_indices = sorted(self.selected)
+            outcome = self._ready_outcome(tuple(sorted(self.cards[i] for i in selected_indices)))
+            if outcome is not None:
+                self.board = outcome.board
+                self.deck.draw(len(outcome.drawn) + 3 * len(outcome.add3))
+                if outcome.drawn:
+                    self._log(event_log.DEAL, outcome.drawn)
+                for new_cards in outcome.add3:
+                    self._log(event_log.ADD3, new_cards)
+            elif len(self.cards) == self.board_size and self.deck.remaining() >= 3:
+                # 12장 → SET 성공 → 3장 제거 + 새 3장 추가 → 12장 유지
+                new_cards = self.deck.draw(3)
+                self.board.replace(selected_indices, new_cards)
+                self._log(event_log.DEAL, new_cards)
+            else:
+                # 15장 이상 → SET 성공 → 3장 제거만
+                for card_idx in reversed(selected_indices):
+                    self.board.pop(card_idx)
+            self._speculate()
+        else:
+            self.set_fail.append((len(self.set_fail) + 1, elapsed))
+        self.selected.clear()
+        self.hint_mode = False
+        return ok
+
+    def has_set(self):
+        return self.board.has_set()
+
+    def can_deal(self):
+        return len(self.cards) + 3 <= self.variant.max_board and self.deck.remaining() >= 3
+
+    # ✅ SET이 없으면 3장 추가 (최대 장수까지, 변형 덱은 최대 장수에서 SET이 반드시 있다)
+    def deal(self):
+        if self.has_set() or not self.can_deal():
+            return False
+        new_cards = self.deck.draw(3)
+        self.board.extend(new_cards)
+        self._log(event_log.ADD3, new_cards)
+        self._speculate()
+        return True
+
+    def is_over(self):
+        return self.started and not self.has_set() and not self.can_deal()
+
+    # ✅ 게임 종료: 저장용 (성공 기록, 실패 기록, 플레이 시간) 반환 후 초기화
+    def finish(self):
+        result = (list(self.set_success), list(self.set_fail), self.elapsed())
+        if self.started:
+            self._log(event_log.END)
+        if self.events is not None:
+            self.events.flush()
+        self.reset()
+        return result
+
+
+# ✅ 자동 플레이어
+def perfect_bot(game, rng):
+    return list(game.board.find_sets()[0])
+
+
+def random_bot(game, rng):
+    return rng.sample(range(len(game.cards)), 3)
+
+
+def hint_bot(game, rng):
+    game.hint()
+    third = game.variant.third(*(game.cards[i] for i in game.selected))
+    return [game.cards.index(third)]
+
+
+BOTS = {"perfect": perfect_bot, "random": random_bot, "hint": hint_bot}
+
+
+# ✅ 한 판을 끝까지 자동 진행 (max_moves 초과 시 중단)
+def play_moves(game, bot, rng, max_moves=1000):
+    game.start()
+    for _ in range(max_moves):
+        while game.deal():
+            pass
+        if game.is_over():
+            break
+        for idx in bot(game, rng):
+            game.select(idx)
+        game.submit()
+
+
+def play_game(game, bot, rng, max_moves=1000):
+    play_moves(game, bot, rng, max_moves)
+    return game.finish()
+
+
+# ✅ 점검: 최대 장수에서 SET이 보장되는 덱(변형 덱)에서 완벽한 봇이 덱을 다 쓰고(3장 미만 남기고) 끝나는지
+# → {덱: 덱이 남은 채 끝난 판 수}. 기본 덱은 원래 15장 규칙이라 덱이 남은 채 끝날 수 있어 제외한다.
+def check_finish(n_games=50, seed=0):
+    stuck = {}
+    for key, variant in set_engine.VARIANTS.items():
+        if not variant.always_finishes_deck():
+            continue
+        rng = random.Random(seed)
+        game = Game(seed=rng.getrandbits(64), clock=lambda: 0, variant=key)
+        stuck[key] = 0
+        for _ in range(n_games):
+            play_moves(game, perfect_bot, rng)
+            stuck[key] += game.deck.remaining() >= 3
+            game.finish()
+    return stuck
+
+
+def simulate(n_games, bot="perfect", seed=None, variant="standard", events_path=None, speculate=False):
+    rng = random.Random(seed)
+    events = event_log.EventWriter(events_path, session=rng.getrandbits(32)) if events_path else None
+    game = Game(seed=rng.getrandbits(64), clock=lambda: 0, variant=variant, events=events, speculate=speculate)
+    choose = BOTS[bot]
+    return [play_game(game, choose, rng) for _ in range(n_games)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 게임 헤드리스 시뮬레이션")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="perfect")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--variant", choices=list(set_engine.VARIANTS), default="standard")
+    parser.add_argument("--events", default=None, help="이벤트 로그를 덧붙일 파일")
+    parser.add_argument("--speculate", action="store_true", help="SET 성공 뒤 보드 미리 계산 사용")
+    parser.add_argument("--check-finish", action="store_true", help="변형 덱이 덱을 다 쓰고 끝나는지 점검")
+    args = parser.parse_args(argv)
+
+    if args.check_finish:
+        stuck = check_finish(min(args.games, 200), seed=args.seed)
+        for key, n in stuck.items():
+            print(f"{'✅' if n == 0 else '❌'} {set_engine.VARIANTS[key].label}: 덱이 남은 채 끝난 판 {n}")
+        return 1 if any(stuck.values()) else 0
+
+    t0 = time.perf_counter()
+    results = simulate(args.games, bot=args.bot, seed=args.seed, variant=args.variant, events_path=args.events,
+                       speculate=args.speculate)
+    elapsed = time.perf_counter() - t0
+
+    successes = sum(len(r[0]) for r in results)
+    fails = sum(len(r[1]) for r in results)
+    print(f"🎲 {set_engine.VARIANTS[args.variant].label} · {args.bot} 봇 {args.games:,}판: 성공 {successes:,}, 실패 {fails:,}")
+    print(f"⏱ {elapsed:.2f}초 ({args.games / elapsed:,.0f}판/초)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,183 @@
+import argparse
+import hashlib
+import json
 import os
-import requests
-
-# 저장할 폴더
-save_dir = "set_cards"
-os.makedirs(save_dir, exist_ok=True)
-
-# 4자리 3진수 조합 생성 (0000 ~ 2222, 총 81개)
-for color in range(3):
-    for shape in range(3):
-        for shading in range(3):
-            for number in range(3):
-                filename = f"{color}{shape}{shading}{number}.png"
-                url = f"https://uiqoo.kr/boardgames/setboardgame/{filename}"
-                response = requests.get(url)
-
-                if response.status_code == 200:
-                    with open(os.path.join(save_dir, filename), "wb") as f:
-                        f.write(response.content)
-                    print(f"✅ Saved: {filename}")
-                else:
-                    print(f"❌ Failed to download: {filename}")
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+import card_art
+import card_cache
+import set_engine
+
+# ✅ 오프라인 카드 에셋 빌드
+# 카드 앞면을 속성 숫자로 직접 그리고(card_art), 여러 프로세스에서 나눠 렌더링한다.
+# manifest.json에 (렌더러 버전, 카드, 너비) 입력 키와 출력 파일 해시를 적어 두고,
+# 다시 빌드할 때는 입력 키가 같고 파일 해시도 맞는 카드는 건너뛴다.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(ROOT, "card_assets")
+WIDTHS = (card_art.BASE_WIDTH,) + card_cache.WIDTHS
+ATLAS_WIDTH = 120
+ATLAS_COLUMNS = 27
+MANIFEST = "manifest.json"
+
+
+def renderer_version():
+    with open(card_art.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _write_png(image, path):
+    tmp = path + ".tmp"
+    image.save(tmp, format="PNG")
+    os.replace(tmp, path)
+
+
+# 작업 하나 = 카드 한 장: 크게 한 번 그리고 너비별로 줄여 저장
+def render_job(job):
+    digits, outputs = job
+    full = card_art.draw_full([int(d) for d in digits])
+    results = []
+    for width, path in outputs:
+        _write_png(card_art.resize(full, width), path)
+        results.append((path, file_hash(path)))
+    return results
+
+
+def load_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {"files": {}, "atlases": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _up_to_date(out_dir, manifest, rel, key):
+    entry = manifest["files"].get(rel)
+    path = os.path.join(out_dir, rel)
+    return entry is not None and entry["key"] == key and os.path.exists(path) and file_hash(path) == entry["sha256"]
+
+
+# ✅ 출력 경로 계획: 바뀐 카드만 작업으로 만든다
+# flat=True면 set_cards/처럼 <out>/<카드>.png 한 가지 너비만 쓴다
+def plan(out_dir, variants, widths, manifest, version, flat=False, force=False):
+    jobs, keys, skipped = [], {}, 0
+    for variant in variants:
+        for cid in variant.cards:
+            name = variant.card_name(cid)
+            outputs = []
+            for width in widths:
+                rel = name if flat else os.path.join(variant.key, str(width), name)
+                key = f"{version}:{name}:{width}"
+                keys[rel] = key
+                if not force and _up_to_date(out_dir, manifest, rel, key):
+                    skipped += 1
+                    continue
+                os.makedirs(os.path.dirname(os.path.join(out_dir, rel)), exist_ok=True)
+                outputs.append((width, os.path.join(out_dir, rel)))
+            if outputs:
+                jobs.append((os.path.splitext(name)[0], outputs))
+    return jobs, keys, skipped
+
+
+# ✅ 스프라이트 아틀라스: 변형 덱 하나의 카드를 ATLAS_COLUMNS열 격자로 한 장에 모으고 위치를 JSON으로
+def build_atlas(out_dir, variant, width, manifest, force=False):
+    rels = [os.path.join(variant.key, str(width), variant.card_name(cid)) for cid in variant.cards]
+    key = hashlib.sha256("".join(manifest["files"][rel]["sha256"] for rel in rels).encode()).hexdigest()
+    image_path = os.path.join(out_dir, variant.key, f"atlas_{width}.png")
+    index_path = os.path.join(out_dir, variant.key, f"atlas_{width}.json")
+    entry = manifest["atlases"].get(variant.key)
+    if (not force and entry is not None and entry["key"] == key
+            and os.path.exists(index_path) and os.path.exists(image_path)
+            and file_hash(image_path) == entry["sha256"]):
+        return False
+
+    card_w = width
+    card_h = round(card_art.BASE_HEIGHT * width / card_art.BASE_WIDTH)
+    columns = min(ATLAS_COLUMNS, len(rels))
+    rows = (len(rels) + columns - 1) // columns
+    atlas = Image.new("RGB", (columns * card_w, rows * card_h), (255, 255, 255))
+    index = {}
+    for i, rel in enumerate(rels):
+        x, y = (i % columns) * card_w, (i // columns) * card_h
+        with Image.open(os.path.join(out_dir, rel)) as im:
+            atlas.paste(im, (x, y))
+        index[os.path.basename(rel)] = [x, y, card_w, card_h]
+    _write_png(atlas, image_path)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"width": atlas.width, "height": atlas.height, "cards": index}, f)
+    manifest["atlases"][variant.key] = {"key": key, "sha256": file_hash(image_path)}
+    return True
+
+
+def build(out_dir, variants, widths, jobs=None, flat=False, atlas=True, force=False):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    version = renderer_version()
+    work, keys, skipped = plan(out_dir, variants, widths, manifest, version, flat=flat, force=force)
+
+    if work:
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1:
+            results = list(map(render_job, work))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(render_job, work, chunksize=max(1, len(work) // (jobs * 8))))
+        for outputs in results:
+            for path, digest in outputs:
+                rel = os.path.relpath(path, out_dir)
+                manifest["files"][rel] = {"key": keys[rel], "sha256": digest}
+
+    atlases = 0
+    if atlas and not flat:
+        for variant in variants:
+            atlases += build_atlas(out_dir, variant, ATLAS_WIDTH if ATLAS_WIDTH in widths else widths[0],
+                                   manifest, force=force)
+    save_manifest(out_dir, manifest)
+    return {"rendered": sum(len(job[1]) for job in work), "skipped": skipped, "atlases": atlases}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 카드 이미지 오프라인 빌드 (절차 생성 + 증분)")
+    parser.add_argument("--variant", choices=list(set_engine.VARIANTS) + ["all"], default="standard")
+    parser.add_argument("--out", default=OUT_DIR, help="출력 폴더")
+    parser.add_argument("--widths", type=int, nargs="+", default=list(WIDTHS))
+    parser.add_argument("--jobs", type=int, default=None, help="프로세스 수 (기본: CPU 개수)")
+    parser.add_argument("--flat", action="store_true",
+                        help="<out>/<카드>.png 한 가지 너비만 생성 (예: --out set_cards --widths 167)")
+    parser.add_argument("--no-atlas", action="store_true")
+    parser.add_argument("--force", action="store_true", help="manifest를 무시하고 모두 다시 생성")
+    args = parser.parse_args(argv)
+
+    keys = list(set_engine.VARIANTS) if args.variant == "all" else [args.variant]
+    variants = [set_engine.VARIANTS[key] for key in keys]
+    widths = args.widths[:1] if args.flat else args.widths
+    if args.flat and len(variants) > 1:
+        parser.error("--flat은 변형 덱 하나만 지정할 수 있습니다.")
+
+    t0 = time.perf_counter()
+    stats = build(args.out, variants, widths, jobs=args.jobs, flat=args.flat,
+                  atlas=not args.no_atlas, force=args.force)
+    elapsed = time.perf_counter() - t0
+    print(f"✅ 생성 {stats['rendered']:,}장, 건너뜀 {stats['skipped']:,}장, 아틀라스 {stats['atlases']}개 "
+          f"({elapsed:.2f}초) → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+GAME_PAGE = os.path.join(ROOT, "pages", "2_Game.py")
+HEAVY_MODULES = ["matplotlib", "pandas"]
+# 예전 utils.py가 import 시점에 하던 일 (비교용)
+EAGER_PRELOAD = """
+import matplotlib.pyplot as plt
+import matplotlib.font_manager as fm
+import pandas as pd
+font_prop = fm.FontProperties(fname=os.path.join(ROOT, "fonts", "NanumGothic-Regular.ttf"))
+plt.rcParams['font.family'] = font_prop.get_name()
+"""
+
+# 새 프로세스에서 게임 페이지 첫 실행: 시작 버튼까지 누른 뒤 시간과 불러온 무거운 모듈 기록
+CHILD = """
+import json, os, sys, time
+ROOT = {root!r}
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+from streamlit.testing.v1 import AppTest
+t0 = time.perf_counter()
+{preload}
+at = AppTest.from_file({page!r}, default_timeout=120)
+at.run()
+t1 = time.perf_counter()
+at.button[0].click().run()
+t2 = time.perf_counter()
+print(json.dumps({{
+    "cold_start_ms": (t1 - t0) * 1000,
+    "first_rerun_ms": (t2 - t1) * 1000,
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules],
+    "exception": [e.message for e in at.exception],
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue
+        name = parts[2]
+        rows.append({"module": name.strip(), "depth": (len(name) - len(name.lstrip())) // 2,
+                     "self_us": int(parts[0]), "cumulative_us": int(parts[1])})
+    return rows
+
+
+def run(preload="", importtime=True):
+    code = CHILD.format(root=ROOT, page=GAME_PAGE, preload=preload, heavy=HEAVY_MODULES)
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(proc.stderr)
+    return result
+
+
+# ✅ 게임 페이지 콜드 스타트 / 첫 실행 시간 비교 리포트 (무거운 모듈을 불러오면 종료 코드 1)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="게임 페이지 import 시간 리포트 (-X importtime)")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 느린 import 개수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    scenarios = {"lazy": "", "eager": EAGER_PRELOAD}
+    report = {}
+    for name, preload in scenarios.items():
+        runs = [run(preload) for _ in range(args.repeat)]
+        runs.sort(key=lambda r: r["cold_start_ms"])
+        median = runs[len(runs) // 2]
+        # 측정 도구(AppTest) 자체의 import는 제외
+        top_level = [r for r in median["imports"]
+                     if r["depth"] == 0 and not r["module"].startswith("streamlit.testing")]
+        report[name] = {
+            "cold_start_ms": round(median["cold_start_ms"], 1),
+            "first_rerun_ms": round(median["first_rerun_ms"], 1),
+            "heavy_modules": median["heavy_modules"],
+            "exception": median["exception"],
+            "slowest_imports": sorted(top_level, key=lambda r: -r["cumulative_us"])[:args.top],
+        }
+
+    lazy, eager = report["lazy"], report["eager"]
+    report["saved_ms"] = round(eager["cold_start_ms"] - lazy["cold_start_ms"], 1)
+    ok = not lazy["heavy_modules"] and not lazy["exception"]
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        for name in scenarios:
+            r = report[name]
+            print(f"[{name}] 콜드 스타트 {r['cold_start_ms']}ms, 첫 실행 {r['first_rerun_ms']}ms, "
+                  f"무거운 모듈 {r['heavy_modules'] or '없음'}")
+        print(f"⏱ 절약: {report['saved_ms']}ms")
+        print("느린 import (lazy):")
+        for r in lazy["slowest_imports"]:
+            print(f"  {r['cumulative_us'] / 1000:8.1f}ms  {r['module']}")
+        if not ok:
+            print(f"❌ 게임 페이지가 {lazy['heavy_modules']} 를 불러왔습니다. {lazy['exception']}", file=sys.stderr)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
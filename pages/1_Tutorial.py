@@ -4,9 +4,9 @@ import streamlit as st
 import os
 import sys
 
-# 상위 디렉토리 경로 추가 (utils.py를 불러오기 위해)
+# 상위 디렉토리 경로 추가 (card_cache.py를 불러오기 위해)
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from utils import CARD_DIR
+import card_cache
 
 # 예시 카드 세트
 set1 = ["0000.png", "0010.png", "0020.png"]
@@ -65,16 +65,16 @@ st.markdown("**SET**은 81장의 카드로 이루어진 보드게임입니다.")
 st.markdown("각 카드는 다음과 같은 4가지 속성을 가지고 있습니다:")
 
 st.markdown("##### 1. 색깔: 빨강, 보라, 초록")
-st.image(["set_cards/0100.png", "set_cards/0110.png", "set_cards/0120.png"], width=130)
+st.image(card_cache.card_images(["0100.png", "0110.png", "0120.png"], 130), width=130)
 
 st.markdown("##### 2. 모양: 타원, 마름모, 물결")
-st.image(["set_cards/2222.png", "set_cards/2122.png", "set_cards/2022.png"], width=130)
+st.image(card_cache.card_images(["2222.png", "2122.png", "2022.png"], 130), width=130)
 
 st.markdown("##### 3. 명암: 색칠된 것, 줄무늬, 빈 것")
-st.image(["set_cards/0211.png", "set_cards/1211.png", "set_cards/2211.png"], width=130)
+st.image(card_cache.card_images(["0211.png", "1211.png", "2211.png"], 130), width=130)
 
 st.markdown("##### 4. 개수: 1개, 2개, 3개")
-st.image(["set_cards/1000.png", "set_cards/1001.png", "set_cards/1002.png"], width=130)
+st.image(card_cache.card_images(["1000.png", "1001.png", "1002.png"], 130), width=130)
 
 st.markdown("---")
 st.markdown("### 🎯 게임 목표")
@@ -93,20 +93,20 @@ st.markdown("아래의 예제에 나온 세 장의 카드 속성을 각각 확
 
 # 예제 1
 st.markdown("### 🎲 예제 1")
-st.image([os.path.join(CARD_DIR, f) for f in set1], width=130)
+st.image(card_cache.card_images(set1, 130), width=130)
 sel1 = show_select_table("set1")
 check_answer_and_display(sel1, answers["set1"], set_type["set1"], 1)
 
 # 예제 2
 st.markdown("---")
 st.markdown("### 🎲 예제 2")
-st.image([os.path.join(CARD_DIR, f) for f in set2], width=130)
+st.image(card_cache.card_images(set2, 130), width=130)
 sel2 = show_select_table("set2")
 check_answer_and_display(sel2, answers["set2"], set_type["set2"], 2)
 
 # 예제 3
 st.markdown("---")
 st.markdown("### 🎲 예제 3")
-st.image([os.path.join(CARD_DIR, f) for f in not_set], width=130)
+st.image(card_cache.card_images(not_set, 130), width=130)
 sel3 = show_select_table("notset")
 check_answer_and_display(sel3, answers["notset"], set_type["notset"], 3)
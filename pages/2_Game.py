@@ -1,188 +1,163 @@
 import streamlit as st
 import sys
 import os
-import random
-import time
 from datetime import timedelta
-from itertools import combinations
 
 # ✅ utils.py에서 기록 저장 함수 불러오기
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils import save_stats_summary
+from game_core import Game
+from event_log import EventWriter
+import card_art
+import set_engine
+import board_render
+import perf
+
+# 관리 페이지에서 예약한 경우 이번 재실행을 cProfile로 한 번 캡처
+if perf.run_profiled("game", __file__):
+    st.stop()
 
-# 카드 이미지 폴더 경로
-CARD_DIR = "set_cards"
-ALL_CARDS = sorted([f for f in os.listdir(CARD_DIR) if f.endswith(".png")])
-
-def get_card_attributes(filename):
-    return [int(ch) for ch in filename[:4]]
-
-def is_set(cards):
-    attrs = [get_card_attributes(c) for c in cards]
-    for i in range(4):
-        values = {attr[i] for attr in attrs}
-        if len(values) == 2:
-            return False
-    return True
+st.set_page_config(page_title="SET 게임", layout="wide")
 
-def any_set_exists(card_list):
-    for a, b, c in combinations(card_list, 3):
-        if is_set([a, b, c]):
-            return True
-    return False
+# 세션 상태 초기화
+if "game" not in st.session_state:
+    st.session_state.game = Game(events=EventWriter(), speculate=True)
+game = st.session_state.game
 
-st.set_page_config(page_title="SET 게임", layout="wide")
 col1, col2 = st.columns([8, 2])
 with col1:
     st.markdown("## 🎮 SET 보드게임")
-with col2:
-    if st.session_state.get("game_started", False):
-        elapsed = int(time.time() - st.session_state.start_time)
-        st.markdown(f"**🕒 경과 시간:** {str(timedelta(seconds=elapsed))}")
+
+# ✅ 경과 시간: 게임 중에는 1초마다 이 부분만 다시 실행
+@st.fragment(run_every=1 if game.started else None)
+def show_timer():
+    if game.started:
+        st.markdown(f"**🕒 경과 시간:** {str(timedelta(seconds=game.elapsed()))}")
     else:
         st.markdown("**🕒 경과 시간:** 00:00:00")
 
+with col2:
+    show_timer()
+
 st.markdown("---")
 
-# 세션 상태 초기화
-if "game_started" not in st.session_state:
-    st.session_state.game_started = False
-    st.session_state.cards = []
-    st.session_state.remaining = ALL_CARDS.copy()
-    st.session_state.selected = []
-    st.session_state.set_success = []
-    st.session_state.set_fail = []
-    st.session_state.start_time = 0
-    st.session_state.hint_mode = False
-
-# 게임 시작
-if not st.session_state.game_started:
+# 게임 시작 (덱 변형 선택)
+if not game.started:
+    variant = st.selectbox(
+        "🃏 덱 선택", list(set_engine.VARIANTS),
+        index=list(set_engine.VARIANTS).index(game.variant.key),
+        format_func=lambda key: set_engine.VARIANTS[key].label,
+    )
     if st.button("🎲 게임 시작하기"):
-        st.session_state.game_started = True
-        st.session_state.start_time = time.time()
-        st.session_state.remaining = ALL_CARDS.copy()
-        st.session_state.cards = random.sample(st.session_state.remaining, 12)
-        for c in st.session_state.cards:
-            st.session_state.remaining.remove(c)
+        game.start(variant)
         st.rerun()
     else:
         st.stop()
 
-# 카드 선택
-def toggle_card(idx):
-    if idx in st.session_state.selected:
-        st.session_state.selected.remove(idx)
-    elif len(st.session_state.selected) < 3:
-        st.session_state.selected.append(idx)
-
-# 힌트 보기
-if st.button("💡 힌트 보기"):
-    for combo in combinations(st.session_state.cards, 3):
-        if is_set(combo):
-            hint_cards = random.sample(combo, 2)
-            st.session_state.selected = [st.session_state.cards.index(c) for c in hint_cards]
-            st.session_state.hint_mode = True
-            st.rerun()
-    st.warning("현재 보드에는 SET이 없습니다.")
-
-# 카드 표시
-cols = st.columns(4)
-for idx, card_file in enumerate(st.session_state.cards):
-    col = cols[idx % 4]
-    card_path = os.path.join(CARD_DIR, card_file)
-    with col:
-        st.image(card_path, width=160)
-        ui_cols = st.columns([1, 5])
-        if ui_cols[0].button("●", key=f"btn_{idx}"):
-            toggle_card(idx)
-            st.rerun()
-        if idx in st.session_state.selected:
-            ui_cols[1].markdown("선택됨")
-
-# SET 판별 로직
-if len(st.session_state.selected) == 3:
-    selected_cards = [st.session_state.cards[i] for i in st.session_state.selected]
-    elapsed = int(time.time() - st.session_state.start_time)
-    if is_set(selected_cards):
-        st.success("🎉 SET 성공!")
-        note = "힌트 사용" if st.session_state.hint_mode else ""
-        st.session_state.set_success.append(
-            (len(st.session_state.set_success)+1, str(timedelta(seconds=elapsed)), note)
-        )
-
-        selected_indices = sorted(st.session_state.selected)
-        card_count_before = len(st.session_state.cards)
-
-        if card_count_before == 12 and len(st.session_state.remaining) >= 3:
-            # 12장 → SET 성공 → 3장 제거 + 새 3장 추가 → 12장 유지
-            new_cards = random.sample(st.session_state.remaining, 3)
-            for i, card_idx in enumerate(selected_indices):
-                st.session_state.cards[card_idx] = new_cards[i]
-                st.session_state.remaining.remove(new_cards[i])
+# 카드 표시 (선택은 버튼 콜백에서 처리해 그리기 전에 반영)
+def show_board_cards():
+    cols = st.columns(4)
+    for idx, card_file in enumerate(game.card_names()):
+        col = cols[idx % 4]
+        with col:
+            st.image(card_art.card_image(card_file, 160), width=160)
+            ui_cols = st.columns([1, 5])
+            ui_cols[0].button("●", key=f"btn_{idx}", on_click=game.select, args=(idx,))
+            if idx in game.selected:
+                ui_cols[1].markdown("선택됨")
+
+# 보드 한 장 합성 모드: 이미지 1개 + 클릭 좌표 → 카드 위치 (직전 클릭을 먼저 반영한 뒤 그린다)
+# streamlit_image_coordinates는 불러오는 데 ~200ms 걸리므로 보드를 처음 그릴 때 불러온다
+def show_board_image():
+    try:
+        from streamlit_image_coordinates import streamlit_image_coordinates
+    except ImportError:
+        streamlit_image_coordinates = None
+    width, _ = board_render.image_size(len(game.cards))
+    if streamlit_image_coordinates is not None:
+        click = st.session_state.get("board_click")
+        if click and click != st.session_state.get("last_board_click"):
+            st.session_state.last_board_click = click
+            scale = click.get("width", width) / width
+            idx = board_render.position_at(click["x"], click["y"], len(game.cards), scale)
+            if idx is not None:
+                game.select(idx)
+        board_png = board_render.render_board(game.card_names(), game.selected)
+        streamlit_image_coordinates(board_render.EncodedImage(board_png), width=width, key="board_click")
+    else:
+        st.image(board_render.render_board(game.card_names(), game.selected), width=width)
+        btn_cols = st.columns(len(game.cards))
+        for idx, col in enumerate(btn_cols):
+            col.button(str(idx + 1), key=f"pick_{idx}", on_click=game.select, args=(idx,))
+
+# ✅ 보드 영역 (3장 추가, 힌트, 카드, 선택 상태, SET 판별): 클릭은 이 부분만 다시 실행하고,
+# 제출로 성공/실패 기록이 바뀔 때만 페이지 전체를 다시 실행한다
+@st.fragment
+def show_board():
+    # 직전 제출 결과 (페이지 전체 재실행 뒤 한 번만 표시)
+    if st.session_state.get("game_message"):
+        kind, text = st.session_state.game_message
+        getattr(st, kind)(text)
+        st.session_state.game_message = None
+
+    # SET이 없으면 3장 추가 (최대 장수까지, SET 확인 + 카드 추가 전체 시간)
+    with perf.timed("auto_deal"):
+        dealt = False
+        while game.deal():
+            dealt = True
+    if dealt:
+        st.warning("⚠️ SET이 없어 3장을 추가합니다!")
+    if game.is_over():
+        st.success("🏁 더 이상 찾을 SET이 없습니다! '게임 종료'를 눌러 기록을 저장하세요.")
+
+    # 힌트 보기
+    if st.button("💡 힌트 보기"):
+        with perf.timed("hint"):
+            found = game.hint()
+        if not found:
+            st.warning("현재 보드에는 SET이 없습니다.")
+
+    with perf.timed("board_render"):
+        if st.toggle("🖼 보드를 한 장으로 보기", key="board_mode"):
+            show_board_image()
         else:
-            # 15장 → SET 성공 → 3장 제거만 → 12장 유지
-            for card_idx in reversed(selected_indices):
-                st.session_state.cards.pop(card_idx)
+            show_board_cards()
 
-        st.session_state.selected.clear()
-        st.session_state.hint_mode = False
-        st.rerun()
-    else:
-        st.error("❌ SET 실패!")
-        st.session_state.set_fail.append(
-            (len(st.session_state.set_fail)+1, str(timedelta(seconds=elapsed)))
-        )
-        st.session_state.selected.clear()
-        st.session_state.hint_mode = False
-        st.rerun()
+    # SET 판별 로직 (미리 계산된 다음 보드를 적용하고, SET이 없으면 같은 재실행 안에서 3장 추가)
+    if len(game.selected) == 3:
+        with perf.timed("set_check"):
+            ok = game.submit()
+            game.deal()
+        st.session_state.game_message = ("success", "🎉 SET 성공!") if ok else ("error", "❌ SET 실패!")
+        st.rerun(scope="app")
 
-# SET이 없으면 3장 추가 (단, 12장일 때만)
-if not any_set_exists(st.session_state.cards):
-    if len(st.session_state.cards) == 12 and len(st.session_state.remaining) >= 3:
-        st.warning("⚠️ SET이 없어 3장을 추가합니다!")
-        new_cards = random.sample(st.session_state.remaining, 3)
-        st.session_state.cards.extend(new_cards)
-        for c in new_cards:
-            st.session_state.remaining.remove(c)
-        st.rerun()
+show_board()
 
 # 게임 종료
 if st.button("🛑 게임 종료"):
-    duration = int(time.time() - st.session_state.start_time)
-    save_stats_summary(
-        st.session_state.set_success,
-        st.session_state.set_fail,
-        duration
-    )
-    st.success("✅ 게임이 종료되었고 결과가 game_records.csv에 저장되었습니다.")
-    st.session_state.game_started = False
-    st.session_state.cards = []
-    st.session_state.remaining = ALL_CARDS.copy()
-    st.session_state.selected = []
-    st.session_state.set_success = []
-    st.session_state.set_fail = []
-    st.session_state.start_time = 0
-    st.session_state.hint_mode = False
+    with perf.timed("save_stats_summary"):
+        save_stats_summary(*game.finish())
+    st.success("✅ 게임이 종료되었고 결과가 기록에 저장되었습니다.")
     st.stop()
 
 # 기록 테이블
 col1, col2 = st.columns(2)
 with col1:
     st.markdown("### ✅ SET 성공 기록")
-    if st.session_state.set_success:
+    if game.set_success:
         st.table(
             {
-                "번호": [s[0] for s in st.session_state.set_success],
-                "시간": [s[1] for s in st.session_state.set_success],
-                "특이사항": [s[2] for s in st.session_state.set_success],
+                "번호": [s[0] for s in game.set_success],
+                "시간": [s[1] for s in game.set_success],
+                "특이사항": [s[2] for s in game.set_success],
             }
         )
 with col2:
     st.markdown("### ❌ SET 실패 기록")
-    if st.session_state.set_fail:
+    if game.set_fail:
         st.table(
             {
-                "번호": [f[0] for f in st.session_state.set_fail],
-                "시간": [f[1] for f in st.session_state.set_fail],
+                "번호": [f[0] for f in game.set_fail],
+                "시간": [f[1] for f in game.set_fail],
             }
         )
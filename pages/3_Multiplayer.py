@@ -0,0 +1,139 @@
+import streamlit as st
+import sys
+import os
+import secrets
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import card_cache
+import rooms
+import set_engine
+
+st.set_page_config(page_title="SET 멀티플레이", layout="wide")
+st.markdown("## 👥 SET 멀티플레이")
+
+# 세션 상태 초기화
+if "mp_room" not in st.session_state:
+    st.session_state.mp_room = None
+    st.session_state.mp_player = ""
+    st.session_state.mp_selected = []
+    st.session_state.mp_version = None
+    st.session_state.mp_message = None
+
+# 플레이어 토큰: 브라우저를 새로고침해도 같은 닉네임으로 다시 들어올 수 있게 주소(쿼리 파라미터)에도 둔다
+if "mp_token" not in st.session_state:
+    st.session_state.mp_token = st.query_params.get("mp") or secrets.token_urlsafe(8)
+    st.query_params["mp"] = st.session_state.mp_token
+token = st.session_state.mp_token
+
+room = rooms.registry.get(st.session_state.mp_room) if st.session_state.mp_room else None
+
+# ✅ 방 만들기 / 입장 (방이 없어졌거나 이 세션의 플레이어가 방에서 빠졌으면 입장 화면)
+if room is None or not room.heartbeat(st.session_state.mp_player, token):
+    name = st.text_input("닉네임", max_chars=12).strip()
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("➕ 새 방 만들기", disabled=not name):
+            room = rooms.registry.create()
+            room.join(name, token)
+            st.session_state.mp_room, st.session_state.mp_player = room.id, name
+            st.rerun()
+    with col2:
+        code = st.text_input("방 코드", max_chars=5).strip().upper()
+        if st.button("🚪 입장하기", disabled=not (name and code)):
+            room = rooms.registry.get(code)
+            status = room.join(name, token) if room is not None else None
+            if status is None:
+                st.error("없는 방입니다.")
+            elif status == "name_taken":
+                st.error("이미 방에서 쓰고 있는 닉네임입니다. 다른 닉네임을 입력해 주세요.")
+            elif status == "full":
+                st.error(f"방이 가득 찼습니다 (최대 {rooms.MAX_PLAYERS}명).")
+            else:
+                st.session_state.mp_room, st.session_state.mp_player = room.id, name
+                st.rerun()
+
+    open_rooms = rooms.registry.list()
+    if open_rooms:
+        st.markdown("### 🏠 열린 방")
+        st.table({
+            "방 코드": [r.id for r in open_rooms],
+            "인원": [len(r.players) for r in open_rooms],
+            "남은 카드": [r.deck.remaining() for r in open_rooms],
+        })
+    st.stop()
+
+player = st.session_state.mp_player
+snapshot = room.poll()
+st.session_state.mp_version = snapshot.version
+
+col1, col2 = st.columns([8, 2])
+with col1:
+    st.markdown(f"**방 코드:** `{room.id}` · **플레이어:** {player} · **남은 카드:** {snapshot.deck_remaining}")
+with col2:
+    if st.button("🚪 나가기"):
+        room.leave(player)
+        st.session_state.mp_room = None
+        st.session_state.mp_selected = []
+        st.rerun()
+
+# ✅ 변경 감시: 1초마다 접속 시각을 갱신하고 버전 번호만 비교해서, 바뀌었을 때만 전체 다시 그리기
+# (오래 응답이 없어 방에서 빠졌으면 전체를 다시 그려 입장 화면으로 돌아간다)
+@st.fragment(run_every=1)
+def watch_room():
+    if not room.heartbeat(player, token) or room.poll(st.session_state.mp_version) is not None:
+        st.rerun()
+
+watch_room()
+
+if st.session_state.mp_message:
+    kind, text = st.session_state.mp_message
+    getattr(st, kind)(text)
+    st.session_state.mp_message = None
+
+event = snapshot.last_event
+if event and event[0] == "ok" and event[1] != player:
+    st.info(f"🏃 {event[1]} 님이 SET을 찾았습니다!")
+
+st.markdown("---")
+
+# 다른 플레이어가 가져간 카드는 선택에서 빼기
+selected = [c for c in st.session_state.mp_selected if c in snapshot.cards]
+st.session_state.mp_selected = selected
+
+# ✅ 카드 표시 (선택은 카드 id로 저장해서 보드가 바뀌어도 어긋나지 않게)
+cols = st.columns(4)
+for idx, card in enumerate(snapshot.cards):
+    with cols[idx % 4]:
+        st.image(card_cache.card_image(set_engine.card_name(card), 160), width=160)
+        ui_cols = st.columns([1, 5])
+        if ui_cols[0].button("●", key=f"mp_btn_{card}"):
+            if card in selected:
+                selected.remove(card)
+            elif len(selected) < 3:
+                selected.append(card)
+            st.rerun()
+        if card in selected:
+            ui_cols[1].markdown("선택됨")
+
+# ✅ SET 제출 (먼저 제출한 사람이 가져감)
+if len(selected) == 3:
+    result = room.claim(player, selected)
+    st.session_state.mp_selected = []
+    st.session_state.mp_message = {
+        "ok": ("success", "🎉 SET 성공!"),
+        "fail": ("error", "❌ SET 실패!"),
+        "taken": ("warning", "⚡ 다른 플레이어가 먼저 가져갔습니다!"),
+        "unknown": ("warning", "방에 다시 입장해 주세요."),
+    }[result]
+    st.rerun()
+
+if snapshot.over:
+    st.success("🏁 게임이 끝났습니다!")
+
+# ✅ 점수판
+st.markdown("### 🏅 점수판")
+st.table({
+    "플레이어": [p[0] for p in snapshot.scores],
+    "성공": [p[1] for p in snapshot.scores],
+    "실패": [p[2] for p in snapshot.scores],
+})
@@ -0,0 +1,91 @@
+import streamlit as st
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import card_art
+import puzzles
+import set_engine
+
+st.set_page_config(page_title="SET 퍼즐", layout="wide")
+st.markdown("## 🧩 오늘의 SET 퍼즐")
+st.markdown("12장 중에 숨어 있는 SET을 **모두** 찾아보세요. 같은 날짜에는 누구나 같은 퍼즐을 받습니다.")
+
+# ✅ 퍼즐 고르기: 날짜 + SET 개수
+counts = [k for k in puzzles.available_counts() if k > 0]
+col1, col2 = st.columns(2)
+with col1:
+    day = st.date_input("날짜", value=date.today(), max_value=date.today())
+with col2:
+    k = st.selectbox("SET 개수", counts, index=counts.index(puzzles.DEFAULT_K),
+                     format_func=lambda k: f"{k}개")
+
+key = (day.isoformat(), k)
+if st.session_state.get("puzzle_key") != key:
+    st.session_state.puzzle_key = key
+    st.session_state.puzzle_cards = puzzles.puzzle(k, day.isoformat())
+    st.session_state.puzzle_found = []
+    st.session_state.puzzle_selected = []
+    st.session_state.puzzle_start = time.time()
+    st.session_state.puzzle_done = None
+    st.session_state.puzzle_message = None
+
+cards = st.session_state.puzzle_cards
+found = st.session_state.puzzle_found
+selected = st.session_state.puzzle_selected
+
+st.markdown(f"**찾은 SET:** {len(found)} / {k}")
+st.progress(len(found) / k)
+
+if st.session_state.puzzle_message:
+    kind, text = st.session_state.puzzle_message
+    if text is None:
+        getattr(st, kind)()
+    else:
+        getattr(st, kind)(text)
+    st.session_state.puzzle_message = None
+
+# ✅ 카드 표시
+cols = st.columns(4)
+for idx, card in enumerate(cards):
+    with cols[idx % 4]:
+        st.image(card_art.card_image(set_engine.card_name(card), 160), width=160)
+        ui_cols = st.columns([1, 5])
+        if ui_cols[0].button("●", key=f"pz_btn_{idx}", disabled=st.session_state.puzzle_done is not None):
+            if idx in selected:
+                selected.remove(idx)
+            elif len(selected) < 3:
+                selected.append(idx)
+            st.rerun()
+        if idx in selected:
+            ui_cols[1].markdown("선택됨")
+
+# ✅ 3장을 고르면 판정: 새 SET / 이미 찾은 SET / SET 아님
+if len(selected) == 3:
+    combo = tuple(sorted(cards[i] for i in selected))
+    if not set_engine.is_set_ids(*combo):
+        st.session_state.puzzle_message = ("error", "❌ SET이 아닙니다!")
+    elif combo in found:
+        st.session_state.puzzle_message = ("warning", "이미 찾은 SET입니다.")
+    else:
+        found.append(combo)
+        st.session_state.puzzle_message = ("success", "🎉 SET 발견!")
+        if len(found) == k:
+            st.session_state.puzzle_done = int(time.time() - st.session_state.puzzle_start)
+            st.session_state.puzzle_message = ("balloons", None)
+    selected.clear()
+    st.rerun()
+
+if st.session_state.puzzle_done is not None:
+    st.success(f"🏁 모든 SET을 찾았습니다! 걸린 시간: {timedelta(seconds=st.session_state.puzzle_done)}")
+
+# ✅ 찾은 SET 목록 (썸네일은 캐시에 있는 120px 이미지를 60px로 표시 — 새 너비를 인코딩하면 캐시의 다른 카드가 밀려난다)
+if found:
+    st.markdown("### ✅ 찾은 SET")
+    for n, combo in enumerate(found, 1):
+        row = st.columns([1, 3, 3, 3, 10])
+        row[0].markdown(f"**{n}**")
+        for col, card in zip(row[1:4], combo):
+            col.image(card_art.card_image(set_engine.card_name(card), 120), width=60)
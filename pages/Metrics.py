@@ -0,0 +1,78 @@
+import streamlit as st
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import perf
+
+# ✅ 페이지 설정
+st.set_page_config(page_title="SET 성능 지표", layout="wide")
+st.markdown("## ⏱ 재실행 성능 지표")
+
+
+# ✅ 관리자 전용: SET_METRICS_ADMIN 환경 변수나 secrets의 metrics_admin이 켜져 있을 때만 보여 준다
+def admin_enabled():
+    value = os.environ.get("SET_METRICS_ADMIN", "")
+    if not value:
+        try:
+            value = str(st.secrets.get("metrics_admin", ""))
+        except FileNotFoundError:  # secrets.toml 없음
+            value = ""
+    return value.lower() not in ("", "0", "false")
+
+
+if not admin_enabled():
+    st.warning("관리자 전용 페이지입니다. SET_METRICS_ADMIN=1로 실행하면 볼 수 있습니다.")
+    st.stop()
+
+# ✅ 계측 켜기/끄기 (프로세스 전체)
+enabled = st.toggle("계측 켜기", value=perf.ENABLED)
+if enabled != perf.ENABLED:
+    perf.set_enabled(enabled)
+    st.rerun()
+
+# ✅ 구간별 p50 / p95 / p99
+summary = perf.summary()
+if summary:
+    st.table({
+        "구간": list(summary),
+        "횟수": [s["count"] for s in summary.values()],
+        "평균(ms)": [round(s["mean"] * 1000, 2) for s in summary.values()],
+        "p50(ms)": [round(s["p50"] * 1000, 2) for s in summary.values()],
+        "p95(ms)": [round(s["p95"] * 1000, 2) for s in summary.values()],
+        "p99(ms)": [round(s["p99"] * 1000, 2) for s in summary.values()],
+    })
+else:
+    st.info("아직 기록된 구간이 없습니다. 계측을 켜고 게임/기록 페이지를 사용해 보세요.")
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    if st.button("💾 지표 파일 내보내기"):
+        paths = perf.export()
+        st.success(f"✅ {paths['prom']}, {paths['json']}")
+with col2:
+    st.download_button("Prometheus 텍스트", perf.to_prometheus(), file_name="metrics.prom")
+with col3:
+    st.download_button("JSON", perf.to_json(), file_name="metrics.json")
+with col4:
+    if st.button("🗑 초기화"):
+        perf.reset()
+        st.rerun()
+
+st.markdown("---")
+
+# ✅ 재실행 한 번 cProfile 캡처
+st.markdown("### 🔬 재실행 프로파일")
+pages = {"game": "🎮 게임", "records": "📊 기록"}
+page = st.selectbox("페이지", list(pages), format_func=pages.get)
+if st.button("다음 재실행 프로파일 예약"):
+    perf.request_profile(page)
+if perf.profile_pending(page):
+    st.info("예약됨: 해당 페이지를 한 번 실행하면 결과가 여기에 표시됩니다.")
+
+profile = perf.last_profile(page)
+if profile:
+    captured = datetime.fromtimestamp(profile["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+    st.markdown(f"**캡처 시각:** {captured} · **실행 시간:** {profile['elapsed'] * 1000:.1f}ms")
+    st.code(profile["stats"])
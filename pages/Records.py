@@ -1,105 +1,110 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 import os
+import sys
 
-# ✅ 한글 폰트 설정
-font_path = os.path.join("fonts", "NanumGothic-Regular.ttf")
-font_prop = fm.FontProperties(fname=font_path)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import records_store
+import records_charts
+import records_tail
+import perf
+from datetime import date, timedelta
+
+# 관리 페이지에서 예약한 경우 이번 재실행을 cProfile로 한 번 캡처
+if perf.run_profiled("records", __file__):
+    st.stop()
 
 # ✅ 페이지 설정
 st.set_page_config(page_title="SET 기록 보기", layout="wide")
 st.markdown("## 📊 게임 기록 시각화")
 
-file_path = "game_records.csv"
+store = records_store.get_store()
+
+# 기간 선택지 (일 수, None = 전체, "custom" = 날짜 직접 선택)
+PERIODS = {"전체": None, "최근 7일": 7, "최근 30일": 30, "최근 90일": 90, "최근 1년": 365, "직접 선택": "custom"}
 
 # ✅ 기록 삭제 버튼
 with st.expander("⚙️ 기록 관리"):
     if st.button("🗑 기록 전체 삭제하기"):
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        if store.exists():
+            store.clear()
             st.success("✅ 모든 기록이 삭제되었습니다.")
             st.stop()
         else:
             st.warning("삭제할 기록 파일이 없습니다.")
             st.stop()
 
-# ✅ 기록 시각화
-if os.path.exists(file_path):
-    df = pd.read_csv(
-        file_path,
-        names=[
-            "날짜", 
-            "힌트 없이 SET 맞춘 횟수", 
-            "힌트 없이 평균 시간(초)", 
-            "힌트 써서 맞춘 SET", 
-            "총 맞춘 SET 개수", 
-            "SET 틀린 횟수", 
-            "SET 틀린 평균 시간(초)", 
-            "총점", 
-            "총 플레이 시간(초)"
-        ]
-    )
-
-    df["날짜"] = pd.to_datetime(df["날짜"])
-    df = df.sort_values("날짜")
-
-    st.markdown("### 📋 전체 게임 기록")
-    st.dataframe(df, use_container_width=True)
-
-    # 🎯 총점 추이
-    st.markdown("### 🎯 총점 변화 추이")
-    fig1, ax1 = plt.subplots()
-    ax1.plot(df["날짜"], df["총점"], marker="o", linestyle="-", color="blue")
-    ax1.set_title("총점 변화 추이", fontproperties=font_prop)
-    ax1.set_xlabel("날짜", fontproperties=font_prop)
-    ax1.set_ylabel("총점", fontproperties=font_prop)
-    ax1.tick_params(axis='x', rotation=45)
-    for label in ax1.get_xticklabels() + ax1.get_yticklabels():
-        label.set_fontproperties(font_prop)
-    st.pyplot(fig1)
-
-
-    # ⏱ 플레이 시간 vs 총점
-    st.markdown("### ⏱ 플레이 시간과 총점의 관계")
-    fig3, ax3 = plt.subplots()
-    ax3.scatter(df["총 플레이 시간(초)"], df["총점"], color="purple", alpha=0.7)
-    ax3.set_title("플레이 시간 vs 총점", fontproperties=font_prop)
-    ax3.set_xlabel("총 플레이 시간 (초)", fontproperties=font_prop)
-    ax3.set_ylabel("총점", fontproperties=font_prop)
-    for label in ax3.get_xticklabels() + ax3.get_yticklabels():
-        label.set_fontproperties(font_prop)
-    st.pyplot(fig3)
-
-    # 📅 날짜별 힌트 없이 맞춘 횟수
-    st.markdown("### 📅 날짜별 힌트 없이 맞춘 횟수")
-    fig5, ax5 = plt.subplots()
-    ax5.plot(df["날짜"], df["힌트 없이 SET 맞춘 횟수"], marker="o", linestyle="-", color="green")
-    ax5.set_title("날짜별 힌트 없이 SET 성공 횟수", fontproperties=font_prop)
-    ax5.set_xlabel("날짜", fontproperties=font_prop)
-    ax5.set_ylabel("힌트 없이 SET 성공", fontproperties=font_prop)
-    ax5.tick_params(axis='x', rotation=45)
-    for label in ax5.get_xticklabels() + ax5.get_yticklabels():
-        label.set_fontproperties(font_prop)
-    st.pyplot(fig5)
-
-    # 🔁 힌트 없이 성공 vs 실패 관계 (산점도)
-    st.markdown("### 🔁 힌트 없이 성공 vs 실패 횟수")
-    fig6, ax6 = plt.subplots()
-    ax6.scatter(df["힌트 없이 SET 맞춘 횟수"], df["SET 틀린 횟수"], color="red", alpha=0.6)
-    ax6.set_title("힌트 없이 성공과 실패의 관계", fontproperties=font_prop)
-    ax6.set_xlabel("힌트 없이 SET 성공", fontproperties=font_prop)
-    ax6.set_ylabel("실패 횟수", fontproperties=font_prop)
-    for label in ax6.get_xticklabels() + ax6.get_yticklabels():
-        label.set_fontproperties(font_prop)
-    st.pyplot(fig6)
-
-
-
-    # 🏅 최고 점수 TOP 5
+# ✅ 기록 시각화 (차트는 기록 데이터 버전별로 캐시)
+if store.exists():
+    # 📈 요약 통계 (새로 추가된 기록만 읽어 누적)
+    with perf.timed("records_tail"):
+        tail = records_tail.get_tail(store)
+    st.markdown("### 📈 요약")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("총 게임 수", tail.games)
+    m2.metric("평균 총점", tail.average_score())
+    m3.metric(f"최근 {tail.window}게임 힌트 없이 평균 시간(초)", tail.rolling_no_hint_time())
+    m4.metric("오늘 게임 수", tail.per_day[date.today().isoformat()])
+
+    # 🗓 기간 선택: 전체가 아니면 Parquet 보관소에서 해당 기간만 읽는다
+    st.markdown("### 🗓 기간")
+    today = date.today()
+    choice = st.selectbox("보기 기간", list(PERIODS), index=0)
+    if PERIODS[choice] == "custom":
+        picked = st.date_input("시작일 ~ 종료일", value=(today - timedelta(days=29), today), max_value=today)
+        period = (picked[0], picked[-1]) if picked else None
+    elif PERIODS[choice] is None:
+        period = None
+    else:
+        period = (today - timedelta(days=PERIODS[choice] - 1), today)
+    df = records_charts.load_frame(store, period)
+
+    if df.empty:
+        st.info("선택한 기간에 저장된 게임 기록이 없습니다.")
+    else:
+        # 📋 전체 기록은 최신순으로 한 페이지씩만 보낸다
+        st.markdown("### 📋 전체 게임 기록")
+        p1, p2 = st.columns([1, 4])
+        page_size = p1.selectbox("페이지당 행 수", [20, 50, 100], index=1)
+        n_pages = max(1, -(-len(df) // page_size))
+        page = p2.number_input(f"페이지 (1 = 최신, 전체 {n_pages:,}페이지)", min_value=1, max_value=n_pages, value=1)
+        st.dataframe(records_charts.page_rows(df, page, page_size), use_container_width=True)
+
+        # 📆 기간별 집계와 분위수 띠
+        st.markdown("### 📆 기간별 집계")
+        freq = st.radio("집계 단위", list(records_charts.FREQS), index=1, horizontal=True,
+                        format_func=records_charts.FREQS.get)
+        # 집계표도 최근 기간부터 한 페이지씩만 보낸다 (일 단위는 기록 기간만큼 길어진다)
+        table = records_charts.load_rollup(store, freq, period)
+        n_rollup_pages = max(1, -(-len(table) // records_charts.ROLLUP_PAGE))
+        rollup_page = st.number_input(f"집계 페이지 (1 = 최근, 전체 {n_rollup_pages:,}페이지)", min_value=1,
+                                      max_value=n_rollup_pages, value=1)
+        st.dataframe(records_charts.page_rows(table, rollup_page, records_charts.ROLLUP_PAGE),
+                     use_container_width=True)
+        st.image(records_charts.chart_png(store, "score_bands", period, freq=freq))
+        st.image(records_charts.chart_png(store, "no_hint_time_bands", period, freq=freq))
+
+        # 🎯 총점 추이
+        st.markdown("### 🎯 총점 변화 추이")
+        st.image(records_charts.chart_png(store, "score_trend", period))
+
+        # ⏱ 플레이 시간 vs 총점
+        st.markdown("### ⏱ 플레이 시간과 총점의 관계")
+        st.image(records_charts.chart_png(store, "time_vs_score", period))
+
+        # 📅 날짜별 힌트 없이 맞춘 횟수
+        st.markdown("### 📅 날짜별 힌트 없이 맞춘 횟수")
+        st.image(records_charts.chart_png(store, "no_hint_by_date", period))
+
+        # 🔁 힌트 없이 성공 vs 실패 관계 (산점도)
+        st.markdown("### 🔁 힌트 없이 성공 vs 실패 횟수")
+        st.image(records_charts.chart_png(store, "success_vs_fail", period))
+
+    # 🏅 최고 점수 TOP 5 (선택한 기간, 저장소의 점수 인덱스로 조회)
     st.markdown("### 🏅 최고 점수 TOP 5")
-    st.table(df.sort_values("총점", ascending=False).head(5).reset_index(drop=True))
+    top5 = pd.DataFrame(store.top_k(5, *(period or ())), columns=records_store.LABELS)
+    top5["날짜"] = pd.to_datetime(top5["날짜"])
+    st.table(top5)
 
 else:
     st.warning("아직 저장된 게임 기록이 없습니다. 먼저 게임을 플레이하세요!")
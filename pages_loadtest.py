@@ -0,0 +1,183 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import perf
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+GAME_PAGE = os.path.join(ROOT, "pages", "2_Game.py")
+RECORDS_PAGE = os.path.join(ROOT, "pages", "Records.py")
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# 한 번의 재실행 시간을 종류별로 기록 (예외가 나면 세션 중단)
+def _run(at, latencies, kind):
+    t0 = time.perf_counter()
+    at.run()
+    latencies[kind].append(time.perf_counter() - t0)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def _button(at, text):
+    return next(b for b in at.button if text in b.label)
+
+
+# ✅ 게임 세션: 시작 → (힌트 또는 직접) 카드 클릭으로 SET 제출 → 몇 개 찾은 뒤 종료(기록 저장) 반복
+def play_session(seed, deadline, args, latencies):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(GAME_PAGE, default_timeout=120)
+    _run(at, latencies, "game_load")
+    games = 0
+    while time.time() < deadline:
+        _button(at, "게임 시작").click()
+        _run(at, latencies, "game_start")
+        game = at.session_state.game
+        for _ in range(rng.randint(args.min_sets, args.max_sets)):
+            if game.is_over() or time.time() >= deadline:
+                break
+            time.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+            if rng.random() < args.hint_rate:
+                _button(at, "힌트").click()
+                _run(at, latencies, "hint")
+                third = game.variant.third(*(game.cards[i] for i in game.selected))
+                picks = [game.cards.index(third)]
+            elif rng.random() < args.mistake_rate:
+                picks = rng.sample(range(len(game.cards)), 3)
+            else:
+                picks = list(rng.choice(game.board.find_sets()))
+            for idx in picks:
+                at.button(key=f"btn_{idx}").click()
+                _run(at, latencies, "card_click")
+        _button(at, "게임 종료").click()
+        _run(at, latencies, "game_end")
+        games += 1
+        _run(at, latencies, "game_load")
+    return {"games": games}
+
+
+# ✅ 기록 보기 세션: 새로고침, 표 페이지 이동, 집계 단위 변경
+def browse_session(seed, deadline, args, latencies):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(RECORDS_PAGE, default_timeout=300)
+    _run(at, latencies, "records_load")
+    views = 0
+    while time.time() < deadline:
+        time.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+        if at.number_input and rng.random() < 0.5:
+            box = at.number_input[0]
+            box.set_value(rng.randint(1, int(box.proto.max) if box.proto.has_max else 1))
+            _run(at, latencies, "records_page")
+        elif at.radio and rng.random() < 0.5:
+            import records_charts
+            at.radio[0].set_value(rng.choice(list(records_charts.FREQS)))
+            _run(at, latencies, "records_rollup")
+        else:
+            _run(at, latencies, "records_load")
+        views += 1
+    return {"views": views}
+
+
+# 자식 프로세스 하나 = 세션 하나 (AppTest는 프로세스 전역 런타임을 쓰므로 스레드로 나눌 수 없다)
+def _session(spec):
+    role, seed, deadline, args = spec
+    latencies = defaultdict(list)
+    target = play_session if role == "player" else browse_session
+    error = None
+    try:
+        result = target(seed, deadline, args, latencies)
+    except Exception as exc:
+        result, error = {}, repr(exc)
+    return {
+        "role": role,
+        "latencies": dict(latencies),
+        "lock_wait": perf.samples("records_lock_wait"),
+        "save": perf.samples("save_stats_summary"),
+        "peak_rss_mb": _peak_rss_mb(),
+        "error": error,
+        **result,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streamlit 페이지 동시 세션 부하 테스트 (AppTest, 로컬 전용)")
+    parser.add_argument("--players", type=int, default=4, help="게임 페이지 세션 수")
+    parser.add_argument("--browsers", type=int, default=2, help="기록 페이지 세션 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="세션별 실행 시간(초)")
+    parser.add_argument("--think-ms", type=float, default=50.0, help="평균 생각 시간")
+    parser.add_argument("--min-sets", type=int, default=3, help="한 판에서 찾을 최소 SET 수")
+    parser.add_argument("--max-sets", type=int, default=8, help="한 판에서 찾을 최대 SET 수")
+    parser.add_argument("--hint-rate", type=float, default=0.2)
+    parser.add_argument("--mistake-rate", type=float, default=0.1)
+    parser.add_argument("--backend", choices=["csv", "sqlite"], default="csv", help="기록 저장소")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 자식 프로세스가 물려받을 환경: 임시 기록/이벤트 파일, 구간 계측 켜기
+        records_path = os.path.join(workdir, "game_records." + ("csv" if args.backend == "csv" else "db"))
+        os.environ["SET_RECORDS_BACKEND"] = args.backend
+        os.environ["SET_RECORDS_PATH"] = records_path
+        os.environ["SET_EVENTS_PATH"] = os.path.join(workdir, "game_events.bin")
+        os.environ["SET_PERF"] = "1"
+
+        deadline = time.time() + args.duration
+        specs = [("player", args.seed * 1000 + i, deadline, args) for i in range(args.players)]
+        specs += [("browser", args.seed * 1000 + 500 + i, deadline, args) for i in range(args.browsers)]
+        t0 = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(len(specs), maxtasksperchild=1) as pool:
+            sessions = pool.map(_session, specs, chunksize=1)
+        elapsed = time.perf_counter() - t0
+
+        sys.path.insert(0, ROOT)
+        import records_store
+        stored = records_store.get_store().count()
+
+    latencies = defaultdict(list)
+    for s in sessions:
+        for kind, values in s["latencies"].items():
+            latencies[kind].extend(values)
+    reruns = sum(len(v) for v in latencies.values())
+    games = sum(s.get("games", 0) for s in sessions)
+    rss = [s["peak_rss_mb"] for s in sessions]
+    report = {
+        "sessions": {"players": args.players, "browsers": args.browsers},
+        "backend": args.backend,
+        "elapsed_sec": round(elapsed, 2),
+        "reruns": reruns,
+        "reruns_per_sec": round(reruns / elapsed, 1),
+        "rerun_latency": {kind: perf.latency_ms(v) for kind, v in sorted(latencies.items())},
+        "all_reruns": perf.latency_ms([x for v in latencies.values() for x in v]),
+        "games_saved": games,
+        "records_stored": stored,
+        "lost_writes": games - stored,
+        "save_latency": perf.latency_ms([x for s in sessions for x in s["save"]]),
+        "lock_wait": perf.latency_ms([x for s in sessions for x in s["lock_wait"]]),
+        "peak_rss_mb": {"mean": round(sum(rss) / len(rss), 1), "max": round(max(rss), 1)},
+        "errors": [s["error"] for s in sessions if s["error"]],
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+    return 0 if not report["errors"] and report["lost_writes"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
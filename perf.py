@@ -0,0 +1,172 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import runpy
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# ✅ 재실행 구간 타이밍 계측
+# SET_PERF=1 일 때만 켜진다. 꺼져 있으면 timed()는 공유 nullcontext를 돌려줄 뿐 아무것도 기록하지 않는다.
+ENABLED = os.environ.get("SET_PERF", "") not in ("", "0")
+RING_SIZE = 2048
+EXPORT_DIR = os.environ.get("SET_PERF_EXPORT_DIR", "metrics")
+QUANTILES = (0.5, 0.95, 0.99)
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_rings = {}
+
+
+def set_enabled(flag):
+    global ENABLED
+    ENABLED = bool(flag)
+
+
+def record(stage, seconds):
+    with _lock:
+        ring = _rings.get(stage)
+        if ring is None:
+            ring = _rings[stage] = deque(maxlen=RING_SIZE)
+        ring.append(seconds)
+
+
+class _Timer:
+    __slots__ = ("stage", "t0")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, time.perf_counter() - self.t0)
+        return False
+
+
+def timed(stage):
+    return _Timer(stage) if ENABLED else _NULL
+
+
+def samples(stage):
+    with _lock:
+        return list(_rings.get(stage, ()))
+
+
+def reset():
+    with _lock:
+        _rings.clear()
+
+
+def quantile(sorted_values, q):
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+# ✅ 지연 시간(초) 목록 → 개수, p50/p95/p99, 최대 (밀리초) — 부하 테스트 보고서용
+def latency_ms(values, digits=2):
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        "count": len(values),
+        **{f"p{round(q * 100)}_ms": round(quantile(values, q) * 1000, digits) for q in QUANTILES},
+        "max_ms": round(values[-1] * 1000, digits),
+    }
+
+
+# ✅ 구간별 요약: 개수, 합계, 평균, p50/p95/p99 (초)
+def summary():
+    with _lock:
+        snapshot = {stage: list(ring) for stage, ring in _rings.items()}
+    result = {}
+    for stage, values in sorted(snapshot.items()):
+        if not values:
+            continue
+        values.sort()
+        result[stage] = {
+            "count": len(values),
+            "sum": sum(values),
+            "mean": sum(values) / len(values),
+            **{f"p{round(q * 100)}": quantile(values, q) for q in QUANTILES},
+        }
+    return result
+
+
+def to_json():
+    return json.dumps({"timestamp": time.time(), "stages": summary()}, indent=2)
+
+
+# ✅ Prometheus 텍스트 형식 (summary 타입)
+def to_prometheus():
+    lines = [
+        "# HELP set_stage_seconds Rerun stage latency in seconds (last %d samples)." % RING_SIZE,
+        "# TYPE set_stage_seconds summary",
+    ]
+    for stage, s in summary().items():
+        for q in QUANTILES:
+            lines.append(f'set_stage_seconds{{stage="{stage}",quantile="{q}"}} {s[f"p{round(q * 100)}"]:.6f}')
+        lines.append(f'set_stage_seconds_sum{{stage="{stage}"}} {s["sum"]:.6f}')
+        lines.append(f'set_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def export(directory=EXPORT_DIR):
+    os.makedirs(directory, exist_ok=True)
+    paths = {"prom": os.path.join(directory, "metrics.prom"), "json": os.path.join(directory, "metrics.json")}
+    for kind, text in (("prom", to_prometheus()), ("json", to_json())):
+        tmp = paths[kind] + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, paths[kind])
+    return paths
+
+
+# ✅ 한 번의 재실행 cProfile 캡처
+# 관리 페이지에서 request_profile(page)로 예약하면, 그 페이지의 다음 재실행 한 번을 프로파일러 아래에서 다시 실행한다.
+_profile_requests = set()
+_profiles = {}
+_local = threading.local()
+
+
+def request_profile(page):
+    with _lock:
+        _profile_requests.add(page)
+
+
+def profile_pending(page):
+    return page in _profile_requests
+
+
+def last_profile(page):
+    return _profiles.get(page)
+
+
+# 페이지 맨 위에서 호출: 예약돼 있으면 페이지 파일을 프로파일러 아래에서 실행하고 True 반환
+def run_profiled(page, path):
+    if getattr(_local, "profiling", False):
+        return False
+    with _lock:
+        if page not in _profile_requests:
+            return False
+        _profile_requests.discard(page)
+    profiler = cProfile.Profile()
+    _local.profiling = True
+    t0 = time.perf_counter()
+    try:
+        profiler.runcall(runpy.run_path, path, run_name="__main__")
+    finally:
+        _local.profiling = False
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(40)
+        _profiles[page] = {
+            "timestamp": time.time(),
+            "elapsed": time.perf_counter() - t0,
+            "stats": out.getvalue(),
+        }
+    return True
@@ -0,0 +1,150 @@
+import argparse
+import functools
+import os
+import random
+import time
+from datetime import date
+from itertools import permutations, product
+
+import numpy as np
+
+import set_engine
+from set_batch import deal_boards, solve_batch
+
+# ✅ 퍼즐 보드 색인: SET 개수(k)별로 12장 보드를 미리 만들어 저장해 두고, 요청 시 O(1)로 꺼낸다
+# 보드는 덱 대칭(속성 순서 24가지 × 속성별 값 순서 6⁴ = 31,104가지) 아래 표준형으로 저장해 중복을 없앤다.
+BOARD_SIZE = 12
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzle_index.npz")
+PER_BUCKET = 200
+DEFAULT_K = 6
+
+
+# ✅ 대칭 표: GROUP[g, card] = 대칭 g를 적용한 카드 id (31,104 × 81)
+@functools.lru_cache(maxsize=None)
+def group_table():
+    attrs = np.array(set_engine.ATTRS, dtype=np.int64)                      # (81, 4)
+    value_perms = np.array(list(permutations(range(3))), dtype=np.int64)     # (6, 3)
+    weights = 3 ** np.arange(set_engine.N_ATTRS - 1, -1, -1)
+    choices = np.array(list(product(range(len(value_perms)), repeat=set_engine.N_ATTRS)))  # (1296, 4)
+    tables = []
+    for order in permutations(range(set_engine.N_ATTRS)):
+        moved = attrs[:, order]                                              # 속성 자리 바꾸기
+        digits = value_perms[choices[:, None, :], moved[None, :, :]]         # 속성별 값 바꾸기 (1296, 81, 4)
+        tables.append(digits @ weights)
+    return np.concatenate(tables).astype(np.uint8)
+
+
+# ✅ 표준형: 모든 대칭을 적용해 정렬한 카드 목록 중 사전순으로 가장 작은 것
+def canonical(board):
+    images = np.sort(group_table()[:, np.asarray(board)], axis=1)
+    rows = np.arange(len(images))
+    for col in range(images.shape[1]):
+        column = images[rows, col]
+        rows = rows[column == column.min()]
+        if len(rows) == 1:
+            break
+    return tuple(int(c) for c in images[rows[0]])
+
+
+# 목표 개수에 가까워지도록 카드 한 장씩 바꿔 보는 국소 탐색 (무작위 보드로 잘 안 나오는 큰 k용)
+def _search(rng, k, steps=2000):
+    deck = list(range(set_engine.N_CARDS))
+    rng.shuffle(deck)
+    board = set_engine.Board(deck[:BOARD_SIZE])
+    rest = deck[BOARD_SIZE:]
+    for _ in range(steps):
+        if board.count_sets() == k:
+            return list(board.cards)
+        idx, swap = rng.randrange(BOARD_SIZE), rng.randrange(len(rest))
+        before = abs(board.count_sets() - k)
+        old = board.cards[idx]
+        board.replace([idx], [rest[swap]])
+        if abs(board.count_sets() - k) <= before:
+            rest[swap] = old
+        else:
+            board.replace([idx], [old])
+    return None
+
+
+def build_index(per_bucket=PER_BUCKET, seed=0, batch=20_000, max_batches=50, search_steps=2000):
+    np_rng = np.random.default_rng(seed)
+    rng = random.Random(seed)
+    buckets = {}
+    for _ in range(max_batches):
+        boards = deal_boards(np_rng, batch, BOARD_SIZE)
+        counts = solve_batch(boards, with_triples=False).counts
+        for board, k in zip(boards, counts):
+            bucket = buckets.setdefault(int(k), set())
+            if len(bucket) < per_bucket:
+                bucket.add(canonical(board))
+        if all(len(b) >= per_bucket for b in buckets.values()):
+            break
+
+    # 무작위 보드로 다 채우지 못한 칸(주로 큰 k)은 국소 탐색으로 채운다
+    for k in range(max(buckets) + 1, 15):
+        buckets.setdefault(k, set())
+    for k, bucket in buckets.items():
+        misses = 0
+        while len(bucket) < per_bucket and misses < 20:
+            board = _search(rng, k, search_steps)
+            if board is None:
+                misses += 1
+                continue
+            before = len(bucket)
+            bucket.add(canonical(board))
+            misses += len(bucket) == before
+    return {k: np.array(sorted(b), dtype=np.uint8) for k, b in sorted(buckets.items()) if b}
+
+
+def save_index(index, path=INDEX_PATH):
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp, **{f"k{k}": boards for k, boards in index.items()})
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=4)
+def load_index(path=INDEX_PATH):
+    with np.load(path) as data:
+        return {int(name[1:]): data[name] for name in data.files}
+
+
+def available_counts(path=INDEX_PATH):
+    return sorted(load_index(path))
+
+
+# ✅ k개짜리 퍼즐 하나 (시드가 같으면 같은 보드)
+# 저장된 표준형에 무작위 대칭과 자리 섞기를 적용해서 내보낸다
+def puzzle(k, seed, path=INDEX_PATH):
+    boards = load_index(path).get(k)
+    if boards is None:
+        raise KeyError(f"SET {k}개짜리 퍼즐이 색인에 없습니다.")
+    rng = random.Random(f"puzzle:{k}:{seed}")
+    board = boards[rng.randrange(len(boards))]
+    table = group_table()
+    cards = [int(c) for c in table[rng.randrange(len(table))][board]]
+    rng.shuffle(cards)
+    return cards
+
+
+def daily_puzzle(day=None, k=DEFAULT_K, path=INDEX_PATH):
+    day = day or date.today()
+    return puzzle(k, day.isoformat(), path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 퍼즐 색인 만들기 (SET 개수별 12장 보드)")
+    parser.add_argument("--per-bucket", type=int, default=PER_BUCKET)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=INDEX_PATH)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    index = build_index(per_bucket=args.per_bucket, seed=args.seed)
+    save_index(index, args.out)
+    print(f"✅ {args.out} ({time.perf_counter() - t0:.1f}초)")
+    for k, boards in index.items():
+        print(f"  SET {k:2d}개: {len(boards):,}판")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+import event_log
+import records_store
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ✅ 게임 기록 Parquet 보관소 (열 단위, 월별 파티션)
+# records_archive/records/month=2025-07/part-*.parquet 처럼 월마다 폴더를 나누고, 파일 안은 played_at 순으로 정렬해
+# 행 그룹 통계(min/max)만 보고도 기간·점수 조건에 안 맞는 파일/행 그룹을 건너뛴다.
+# 저장소의 rows_since 커서를 _state.json에 남겨 두고 새로 추가된 기록만 덧붙인다.
+ARCHIVE_PATH = os.environ.get("SET_ARCHIVE_PATH", "records_archive")
+ROW_GROUP = 10_000
+COMPACT_AFTER = 16
+
+_COLUMN_TYPES = [pa.timestamp("s"), pa.int32(), pa.float64(), pa.int32(), pa.int32(), pa.int32(), pa.float64(),
+                 pa.int32(), pa.int32()]
+RECORD_SCHEMA = pa.schema([(name, t) for name, t in zip(records_store.FIELDS, _COLUMN_TYPES)] + [("month", pa.string())])
+
+# 이벤트 로그는 단조 시각만 있으므로 보관한 날의 월로 파티션한다
+EVENT_DTYPE = np.dtype([("ts", "<f8"), ("session", "<u4"), ("kind", "<u2"),
+                        ("card0", "<u2"), ("card1", "<u2"), ("card2", "<u2")])
+EVENT_SCHEMA = pa.schema([("ts", pa.float64()), ("session", pa.uint32()), ("kind", pa.uint8()),
+                          ("card0", pa.uint16()), ("card1", pa.uint16()), ("card2", pa.uint16()),
+                          ("month", pa.string())])
+MONTH = ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive")
+
+_lock = threading.Lock()
+
+
+def _records_dir(path):
+    return os.path.join(path, "records")
+
+
+def _events_dir(path):
+    return os.path.join(path, "events")
+
+
+def _load_state(path):
+    try:
+        with open(os.path.join(path, "_state.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save_state(path, state):
+    tmp = os.path.join(path, "_state.json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, os.path.join(path, "_state.json"))
+
+
+# played_at 순으로 정렬해 월별 폴더에 새 파일로 덧붙인다
+def _append(table, base_dir):
+    table = table.sort_by("played_at" if "played_at" in table.column_names else "ts")
+    ds.write_dataset(
+        table, base_dir, format="parquet", partitioning=MONTH,
+        basename_template=f"part-{time.time_ns()}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=ROW_GROUP, min_rows_per_group=min(ROW_GROUP, max(1, len(table))),
+    )
+    return sorted(set(table.column("month").to_pylist()))
+
+
+def _records_table(rows):
+    columns = list(zip(*rows))
+    arrays = [pc.strptime(pa.array(columns[0], pa.string()), format="%Y-%m-%d %H:%M:%S", unit="s")]
+    arrays += [pa.array(values, t) for values, t in zip(columns[1:], _COLUMN_TYPES[1:])]
+    arrays.append(pa.array([played_at[:7] for played_at in columns[0]], pa.string()))
+    return pa.Table.from_arrays(arrays, schema=RECORD_SCHEMA)
+
+
+def _events_table(raw, month):
+    events = np.frombuffer(raw, dtype=EVENT_DTYPE)
+    arrays = [pa.array(events["ts"]), pa.array(events["session"]), pa.array(events["kind"].astype(np.uint8))]
+    for name in ("card0", "card1", "card2"):
+        column = events[name]
+        arrays.append(pa.array(column, mask=column == event_log.NONE))
+    arrays.append(pa.array([month] * len(events), pa.string()))
+    return pa.Table.from_arrays(arrays, schema=EVENT_SCHEMA)
+
+
+# ✅ 한 달에 작은 파일이 COMPACT_AFTER개를 넘으면 정렬된 파일 하나로 합친다
+def compact(path=None, months=None, threshold=COMPACT_AFTER):
+    path = path or ARCHIVE_PATH
+    merged = 0
+    for base_dir in (_records_dir(path), _events_dir(path)):
+        if not os.path.isdir(base_dir):
+            continue
+        for part in sorted(os.listdir(base_dir)):
+            month = part.partition("=")[2]
+            if months is not None and month not in months:
+                continue
+            month_dir = os.path.join(base_dir, part)
+            files = sorted(f for f in os.listdir(month_dir) if f.endswith(".parquet"))
+            if len(files) <= threshold:
+                continue
+            table = pq.read_table([os.path.join(month_dir, f) for f in files])
+            table = table.sort_by("played_at" if "played_at" in table.column_names else "ts")
+            # "_"로 시작하는 이름은 데이터셋 읽기에서 무시되므로, 쓰는 도중의 파일이 조회에 섞이지 않는다
+            tmp = os.path.join(month_dir, "_compact.parquet.tmp")
+            pq.write_table(table, tmp, row_group_size=ROW_GROUP)
+            os.replace(tmp, os.path.join(month_dir, f"part-{time.time_ns()}-0.parquet"))
+            for f in files:
+                os.remove(os.path.join(month_dir, f))
+            merged += 1
+    return merged
+
+
+# ✅ 증분 보관: 저장소(와 이벤트 로그)에서 마지막 동기화 이후 추가된 것만 Parquet으로 덧붙인다
+# 저장소가 비워졌거나 다른 저장소로 바뀌면 처음부터 다시 만든다. → (추가된 기록 수, 추가된 이벤트 수)
+def sync(store=None, path=None, events_path=None):
+    store = store or records_store.get_store()
+    path = path or ARCHIVE_PATH
+    os.makedirs(path, exist_ok=True)
+    with _lock, open(os.path.join(path, ".lock"), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        state = _load_state(path)
+        source = [type(store).__name__, os.path.abspath(store.path)]
+        cursor = state.get("cursor") if state.get("source") == source else None
+        rows, new_cursor, reset = store.rows_since(tuple(cursor) if cursor else None)
+        if cursor is None or reset:
+            shutil.rmtree(_records_dir(path), ignore_errors=True)
+        touched = _append(_records_table(rows), _records_dir(path)) if rows else []
+        state.update(source=source, cursor=new_cursor)
+
+        n_events = 0
+        if events_path is not None:
+            n_events, state["events"] = _sync_events(path, events_path, state.get("events"))
+        _save_state(path, state)
+        compact(path, touched)
+    return len(rows), n_events
+
+
+def _sync_events(path, events_path, cursor):
+    try:
+        st = os.stat(events_path)
+    except FileNotFoundError:
+        return 0, cursor
+    ino, offset = cursor or (st.st_ino, 0)
+    if cursor is None or ino != st.st_ino or st.st_size < offset:
+        shutil.rmtree(_events_dir(path), ignore_errors=True)
+        offset = 0
+    with open(events_path, "rb") as f:
+        f.seek(offset)
+        raw = f.read()
+    raw = raw[:len(raw) - len(raw) % event_log.RECORD.size]
+    if raw:
+        _append(_events_table(raw, date.today().strftime("%Y-%m")), _events_dir(path))
+    return len(raw) // event_log.RECORD.size, [st.st_ino, offset + len(raw)]
+
+
+# ✅ 조건 식: 월 파티션으로 폴더를 거르고, played_at/score 통계로 행 그룹을 거른다 (end는 그날 포함)
+def record_filter(start=None, end=None, min_score=None, max_score=None):
+    expr = None
+
+    def both(e):
+        return e if expr is None else expr & e
+
+    if start is not None:
+        expr = both((ds.field("month") >= start.strftime("%Y-%m"))
+                    & (ds.field("played_at") >= datetime.combine(start, dtime.min)))
+    if end is not None:
+        expr = both((ds.field("month") <= end.strftime("%Y-%m"))
+                    & (ds.field("played_at") < datetime.combine(end + timedelta(days=1), dtime.min)))
+    if min_score is not None:
+        expr = both(ds.field("score") >= min_score)
+    if max_score is not None:
+        expr = both(ds.field("score") <= max_score)
+    return expr
+
+
+def records_dataset(path=None):
+    return ds.dataset(_records_dir(path or ARCHIVE_PATH), format="parquet", partitioning=MONTH,
+                      schema=RECORD_SCHEMA)
+
+
+def read_records(start=None, end=None, min_score=None, max_score=None, columns=None, path=None):
+    if not os.path.isdir(_records_dir(path or ARCHIVE_PATH)):
+        return RECORD_SCHEMA.empty_table().select(columns or records_store.FIELDS)
+    table = records_dataset(path).to_table(columns=columns or records_store.FIELDS,
+                                           filter=record_filter(start, end, min_score, max_score))
+    return table.sort_by("played_at") if "played_at" in table.column_names else table
+
+
+# ✅ 기록 페이지용 DataFrame (records_charts와 같은 한글 열 이름, 날짜는 datetime)
+def read_frame(start=None, end=None, min_score=None, max_score=None, path=None):
+    df = read_records(start, end, min_score, max_score, path=path).to_pandas()
+    df.columns = records_store.LABELS
+    df["날짜"] = pd.to_datetime(df["날짜"])
+    return df
+
+
+def read_events(path=None):
+    base_dir = _events_dir(path or ARCHIVE_PATH)
+    if not os.path.isdir(base_dir):
+        return EVENT_SCHEMA.empty_table()
+    return ds.dataset(base_dir, format="parquet", partitioning=MONTH, schema=EVENT_SCHEMA).to_table()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="게임 기록 Parquet 보관 / 조회")
+    parser.add_argument("--path", default=None, help="보관소 폴더 (기본 SET_ARCHIVE_PATH 또는 records_archive)")
+    parser.add_argument("--events", action="store_true", help="한 수 단위 이벤트 로그도 보관")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="조회 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="조회 종료일 (포함)")
+    parser.add_argument("--min-score", type=int, default=None)
+    parser.add_argument("--max-score", type=int, default=None)
+    parser.add_argument("--out", default=None, help="조회 결과를 저장할 .parquet 또는 .csv")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    added, n_events = sync(path=args.path, events_path=event_log.EVENTS_PATH if args.events else None)
+    print(f"📦 기록 {added:,}개 · 이벤트 {n_events:,}개 추가 ({time.perf_counter() - t0:.2f}초)")
+
+    t0 = time.perf_counter()
+    table = read_records(args.start, args.end, args.min_score, args.max_score, path=args.path)
+    print(f"🔎 조건에 맞는 기록 {table.num_rows:,}개 ({time.perf_counter() - t0:.3f}초)")
+    if args.out:
+        if args.out.endswith(".csv"):
+            table.to_pandas().to_csv(args.out, index=False)
+        else:
+            pq.write_table(table, args.out, row_group_size=ROW_GROUP)
+        print(f"✅ {args.out}")
+
+
+if __name__ == "__main__":
+    main()
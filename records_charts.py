@@ -0,0 +1,236 @@
+import io
+import os
+import threading
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+import perf
+import records_archive
+import records_store
+import utils
+
+
+# ✅ 그래프에 그리는 점 수 상한: 넘으면 선 그래프는 LTTB로 줄이고, 산점도는 육각형 밀도로 그린다
+MAX_POINTS = 1000
+ROLLING_GAMES = 50
+BANDS = (0.1, 0.5, 0.9)
+FREQS = {"D": "일", "W": "주"}
+ROLLUP_PAGE = 30
+
+
+# ✅ LTTB(Largest-Triangle-Three-Buckets): 모양을 유지하며 n_out개 점의 위치만 고른다
+def lttb(x, y, n_out=MAX_POINTS):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        nxt = slice(edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def _line(ax, dates, values, **kwargs):
+    if len(values) > MAX_POINTS:
+        idx = lttb(dates.astype("int64"), values, MAX_POINTS)
+        dates, values = dates.iloc[idx], values.iloc[idx]
+        kwargs.pop("marker", None)
+    ax.plot(dates, values, **kwargs)
+
+
+def _scatter(ax, x, y, **kwargs):
+    if len(x) > MAX_POINTS:
+        ax.hexbin(x, y, gridsize=40, mincnt=1, cmap="viridis")
+    else:
+        ax.scatter(x, y, **kwargs)
+
+
+# ✅ 기간별 집계 (일/주): 게임 수, 총점과 힌트 없이 평균 시간의 평균·분위수
+def rollup(df, freq="W"):
+    grouped = df.set_index("날짜").resample(freq)
+    out = pd.DataFrame({"게임 수": grouped["총점"].count(), "평균 총점": grouped["총점"].mean()})
+    for q in BANDS:
+        out[f"총점 p{round(q * 100)}"] = grouped["총점"].quantile(q)
+    no_hint = df[df["힌트 없이 SET 맞춘 횟수"] > 0].set_index("날짜").resample(freq)["힌트 없이 평균 시간(초)"]
+    out["힌트 없이 평균 시간(초)"] = no_hint.mean()
+    for q in BANDS:
+        out[f"힌트 없이 시간 p{round(q * 100)}"] = no_hint.quantile(q)
+    out = out[out["게임 수"] > 0].round(2)
+    out.index.name = "기간"
+    return out
+
+
+# ✅ 최근 N게임 이동평균 (게임 순서 기준)
+def rolling(df, window=ROLLING_GAMES):
+    no_hint = df["힌트 없이 평균 시간(초)"].where(df["힌트 없이 SET 맞춘 횟수"] > 0)
+    return pd.DataFrame({
+        "날짜": df["날짜"],
+        "총점": df["총점"].rolling(window, min_periods=1).mean(),
+        "힌트 없이 평균 시간(초)": no_hint.rolling(window, min_periods=1).mean(),
+    })
+
+
+# ✅ 표 페이지: 최신 기록부터 page_size개씩 (1페이지 = 가장 최근)
+def page_rows(df, page, page_size):
+    end = max(0, len(df) - (page - 1) * page_size)
+    return df.iloc[max(0, end - page_size):end].iloc[::-1]
+
+
+def _score_trend(df, ax):
+    _line(ax, df["날짜"], df["총점"], marker="o", linestyle="-", color="blue")
+    ax.set_title("총점 변화 추이")
+    ax.set_xlabel("날짜")
+    ax.set_ylabel("총점")
+    ax.tick_params(axis='x', rotation=45)
+
+
+def _time_vs_score(df, ax):
+    _scatter(ax, df["총 플레이 시간(초)"], df["총점"], color="purple", alpha=0.7)
+    ax.set_title("플레이 시간 vs 총점")
+    ax.set_xlabel("총 플레이 시간 (초)")
+    ax.set_ylabel("총점")
+
+
+def _no_hint_by_date(df, ax):
+    _line(ax, df["날짜"], df["힌트 없이 SET 맞춘 횟수"], marker="o", linestyle="-", color="green")
+    ax.set_title("날짜별 힌트 없이 SET 성공 횟수")
+    ax.set_xlabel("날짜")
+    ax.set_ylabel("힌트 없이 SET 성공")
+    ax.tick_params(axis='x', rotation=45)
+
+
+def _success_vs_fail(df, ax):
+    _scatter(ax, df["힌트 없이 SET 맞춘 횟수"], df["SET 틀린 횟수"], color="red", alpha=0.6)
+    ax.set_title("힌트 없이 성공과 실패의 관계")
+    ax.set_xlabel("힌트 없이 SET 성공")
+    ax.set_ylabel("실패 횟수")
+
+
+# 기간별 p10~p90 띠 + 중앙값 + 최근 N게임 이동평균
+def _bands(df, ax, column, prefix, title, color, freq):
+    table = rollup(df, freq)
+    ax.fill_between(table.index, table[f"{prefix} p10"], table[f"{prefix} p90"], color=color, alpha=0.2,
+                    label="p10~p90")
+    roll = rolling(df)
+    _line(ax, roll["날짜"], roll[column].ffill(), color="gray", linewidth=1,
+          label=f"최근 {ROLLING_GAMES}게임 평균")
+    ax.plot(table.index, table[f"{prefix} p50"], color=color, linewidth=2, label="중앙값",
+            marker="o" if len(table) < 30 else None)
+    ax.set_title(f"{FREQS[freq]}별 {title}")
+    ax.set_xlabel("날짜")
+    ax.set_ylabel(title)
+    ax.legend()
+    ax.tick_params(axis='x', rotation=45)
+
+
+def _score_bands(df, ax, freq="W"):
+    _bands(df, ax, "총점", "총점", "총점 분포", "blue", freq)
+
+
+def _no_hint_time_bands(df, ax, freq="W"):
+    _bands(df, ax, "힌트 없이 평균 시간(초)", "힌트 없이 시간", "힌트 없이 평균 시간(초)", "green", freq)
+
+
+CHARTS = {
+    "score_trend": _score_trend,
+    "time_vs_score": _time_vs_score,
+    "no_hint_by_date": _no_hint_by_date,
+    "success_vs_fail": _success_vs_fail,
+    "score_bands": _score_bands,
+    "no_hint_time_bands": _no_hint_time_bands,
+}
+
+# ✅ 프로세스 전체 캐시: 저장소·기간별 (데이터 버전, DataFrame, 차트 PNG)
+# 기간(start, end)이 있으면 Parquet 보관소를 증분 동기화한 뒤 해당 월 파티션/행 그룹만 읽는다
+# _lock은 캐시 조회/저장에만 잡고, 읽기·동기화·집계·차트 그리기는 잠금 밖에서 한다
+MAX_PERIODS = 8
+_lock = threading.Lock()
+_cache = {}
+# rc_context가 전역 rcParams를 바꾸므로 차트 그리기는 한 번에 하나씩
+_render_lock = threading.Lock()
+
+
+def _store_key(store):
+    return (type(store).__name__, os.path.abspath(store.path))
+
+
+def _entry(store, period=None):
+    key = _store_key(store) + (period,)
+    revision = store.revision()
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and entry["revision"] == revision:
+        return entry
+    if period is None:
+        df = pd.DataFrame(store.all_rows(), columns=records_store.LABELS)
+        df["날짜"] = pd.to_datetime(df["날짜"])
+    else:
+        records_archive.sync(store)
+        df = records_archive.read_frame(*period)
+    with _lock:
+        # 그사이 다른 세션이 같은(또는 더 새) 버전을 넣었으면 그것을 쓴다
+        entry = _cache.get(key)
+        if entry is not None and entry["revision"] >= revision:
+            return entry
+        _cache.pop(key, None)
+        entry = _cache[key] = {"revision": revision, "df": df, "charts": {}, "rollups": {}}
+        # 오래된 기간 캐시부터 버린다 (전체 기간은 유지)
+        periods = [k for k in _cache if k[-1] is not None]
+        for old in periods[:-MAX_PERIODS]:
+            del _cache[old]
+    return entry
+
+
+# ✅ 현재 데이터 버전의 기록 DataFrame (새 게임이 저장될 때만 다시 읽는다)
+def load_frame(store, period=None):
+    with perf.timed("records_load"):
+        return _entry(store, period)["df"]
+
+
+# ✅ 기간별 집계표 (데이터 버전 + 단위별 캐시)
+def load_rollup(store, freq="W", period=None):
+    with perf.timed("records_rollup"):
+        entry = _entry(store, period)
+        with _lock:
+            table = entry["rollups"].get(freq)
+        if table is None:
+            table = rollup(entry["df"], freq)
+            with _lock:
+                table = entry["rollups"].setdefault(freq, table)
+        return table
+
+
+def render_chart(df, name, **params):
+    # 한글 폰트는 프로세스당 한 번 등록 (눈금 라벨마다 FontProperties를 지정하지 않는다)
+    with _render_lock, matplotlib.rc_context(utils.korean_font_rc()):
+        fig = Figure()
+        CHARTS[name](df, fig.subplots(), **params)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+
+# ✅ 차트 PNG 바이트 (데이터 버전이 같으면 모든 세션에서 캐시 재사용)
+def chart_png(store, name, period=None, **params):
+    key = (name,) + tuple(sorted(params.items()))
+    with perf.timed("records_chart"):
+        entry = _entry(store, period)
+        with _lock:
+            data = entry["charts"].get(key)
+        if data is None:
+            data = render_chart(entry["df"], name, **params)
+            with _lock:
+                data = entry["charts"].setdefault(key, data)
+        return data
@@ -0,0 +1,273 @@
+import csv
+import io
+import os
+import sqlite3
+import threading
+from datetime import timedelta
+
+import perf
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ✅ 게임 기록 한 줄의 필드 (game_records.csv 열 순서와 동일)
+FIELDS = [
+    "played_at",
+    "no_hint_success",
+    "avg_no_hint_time",
+    "hint_success",
+    "total_success",
+    "total_fail",
+    "avg_fail_time",
+    "score",
+    "duration_sec",
+]
+# 화면 표시용 한글 열 이름
+LABELS = [
+    "날짜",
+    "힌트 없이 SET 맞춘 횟수",
+    "힌트 없이 평균 시간(초)",
+    "힌트 써서 맞춘 SET",
+    "총 맞춘 SET 개수",
+    "SET 틀린 횟수",
+    "SET 틀린 평균 시간(초)",
+    "총점",
+    "총 플레이 시간(초)",
+]
+_TYPES = [str, int, float, int, int, int, float, int, int]
+
+CSV_PATH = "game_records.csv"
+DB_PATH = "game_records.db"
+
+
+def _parse_row(values):
+    return tuple(t(v) for t, v in zip(_TYPES, values))
+
+
+# 기간(시작일, 종료일 포함) → played_at 문자열 범위 [from, to)
+def _period_bounds(start=None, end=None):
+    low = start.isoformat() if start is not None else ""
+    high = (end + timedelta(days=1)).isoformat() if end is not None else "\uffff"
+    return low, high
+
+
+# ✅ CSV 백엔드: 헤더 없는 append-only 파일 (파일 잠금으로 동시 추가 보호)
+class CSVRecordsStore:
+    def __init__(self, path=CSV_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def insert(self, row):
+        with self._lock, open(self.path, mode="a", newline="", encoding="utf-8") as f:
+            if fcntl is not None:
+                # 다른 프로세스와의 쓰기 경합 (SET_PERF=1일 때만 기록)
+                with perf.timed("records_lock_wait"):
+                    fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                csv.writer(f).writerow(row)
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def all_rows(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, newline="", encoding="utf-8") as f:
+            rows = [_parse_row(r) for r in csv.reader(f) if r]
+        return sorted(rows)
+
+    # ✅ 최고 점수 TOP K (기록 페이지 순위표의 원본, start~end 기간만)
+    def top_k(self, k=5, start=None, end=None):
+        low, high = _period_bounds(start, end)
+        rows = [r for r in self.all_rows() if low <= r[0] < high]
+        return sorted(rows, key=lambda r: (-r[7], r[0]))[:k]
+
+    def count(self):
+        return len(self.all_rows())
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    # ✅ 커서(inode, 바이트 오프셋) 이후에 추가된 줄만 읽기 → (행 목록, 새 커서, 처음부터 다시 읽었는지)
+    def rows_since(self, cursor=None):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return [], None, cursor is not None
+        ino, offset = cursor or (st.st_ino, 0)
+        reset = ino != st.st_ino or st.st_size < offset
+        if reset:
+            offset = 0
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # 아직 쓰는 중인 마지막 줄은 다음에 읽는다
+        end = data.rfind(b"\n") + 1
+        rows = [_parse_row(r) for r in csv.reader(io.StringIO(data[:end].decode("utf-8"))) if r]
+        return rows, (st.st_ino, offset + end), reset
+
+    # ✅ 데이터 버전: 파일 크기 + 수정 시각 (없으면 None)
+    def revision(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+# ✅ SQLite 백엔드 (WAL 모드, 트랜잭션 추가, 날짜/점수 인덱스)
+class SQLiteRecordsStore:
+    def __init__(self, path=DB_PATH, migrate_from=None):
+        self.path = path
+        self._local = threading.local()
+        self._conn().executescript("""
+                CREATE TABLE IF NOT EXISTS records (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    played_at TEXT NOT NULL,
+                    no_hint_success INTEGER NOT NULL,
+                    avg_no_hint_time REAL NOT NULL,
+                    hint_success INTEGER NOT NULL,
+                    total_success INTEGER NOT NULL,
+                    total_fail INTEGER NOT NULL,
+                    avg_fail_time REAL NOT NULL,
+                    score INTEGER NOT NULL,
+                    duration_sec INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_records_played_at ON records (played_at);
+                CREATE INDEX IF NOT EXISTS idx_records_score ON records (score DESC, played_at);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', '0');
+                INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', '0');
+            """)
+        if migrate_from is None:
+            migrate_from = os.path.join(os.path.dirname(path), CSV_PATH)
+        if migrate_from:
+            self.migrate_csv(migrate_from)
+
+    # 스레드별 연결 (autocommit, 쓰기는 _transaction으로 묶는다)
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._conn())
+
+    def insert(self, row):
+        self.insert_many([row])
+
+    def insert_many(self, rows):
+        placeholders = ", ".join("?" * len(FIELDS))
+        with self._transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO records ({', '.join(FIELDS)}) VALUES ({placeholders})",
+                (_parse_row(r) for r in rows),
+            )
+            _bump_revision(conn)
+
+    def all_rows(self):
+        return self._conn().execute(f"SELECT {', '.join(FIELDS)} FROM records ORDER BY played_at, id").fetchall()
+
+    # ✅ 최고 점수 TOP K (기록 페이지 순위표의 원본, 점수 인덱스 순회, start~end 기간만)
+    def top_k(self, k=5, start=None, end=None):
+        low, high = _period_bounds(start, end)
+        return self._conn().execute(
+            f"SELECT {', '.join(FIELDS)} FROM records WHERE played_at >= ? AND played_at < ? "
+            "ORDER BY score DESC, played_at LIMIT ?", (low, high, k)
+        ).fetchall()
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def exists(self):
+        return self.count() > 0
+
+    def clear(self):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM records")
+            conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'epoch'")
+            _bump_revision(conn)
+
+    # ✅ 커서(삭제 세대, 마지막 id) 이후에 추가된 행만 읽기 → (행 목록, 새 커서, 처음부터 다시 읽었는지)
+    def rows_since(self, cursor=None):
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            epoch = int(conn.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()[0])
+            reset = cursor is not None and cursor[0] != epoch
+            last_id = 0 if cursor is None or reset else cursor[1]
+            rows = conn.execute(
+                f"SELECT id, {', '.join(FIELDS)} FROM records WHERE id > ? ORDER BY id", (last_id,)
+            ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        if rows:
+            last_id = rows[-1][0]
+        return [r[1:] for r in rows], (epoch, last_id), reset
+
+    # ✅ 데이터 버전: 추가/삭제 트랜잭션마다 1씩 증가하는 카운터
+    def revision(self):
+        return int(self._conn().execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()[0])
+
+    # ✅ 기존 game_records.csv를 한 번만 가져오기
+    def migrate_csv(self, csv_path):
+        if not os.path.exists(csv_path):
+            return 0
+        with self._transaction() as conn:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'migrated_csv'").fetchone()
+            if done:
+                return 0
+            rows = CSVRecordsStore(csv_path).all_rows()
+            conn.executemany(
+                f"INSERT INTO records ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})", rows
+            )
+            conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_csv', ?)", (os.path.abspath(csv_path),))
+            _bump_revision(conn)
+        return len(rows)
+
+
+def _bump_revision(conn):
+    conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+
+
+# BEGIN IMMEDIATE ... COMMIT / ROLLBACK
+class _Transaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        with perf.timed("records_lock_wait"):
+            self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+BACKENDS = {"sqlite": SQLiteRecordsStore, "csv": CSVRecordsStore}
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+# ✅ 프로세스 전체에서 공유하는 기록 저장소 (SET_RECORDS_BACKEND / SET_RECORDS_PATH 환경 변수로 변경)
+def get_store(backend=None, path=None):
+    backend = backend or os.environ.get("SET_RECORDS_BACKEND", "sqlite")
+    path = path or os.environ.get("SET_RECORDS_PATH") or (DB_PATH if backend == "sqlite" else CSV_PATH)
+    key = (backend, os.path.abspath(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = BACKENDS[backend](path)
+        return store
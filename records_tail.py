@@ -0,0 +1,80 @@
+import os
+import threading
+from collections import Counter, deque
+
+import records_store
+
+ROLLING_WINDOW = 10
+
+_F = {name: i for i, name in enumerate(records_store.FIELDS)}
+
+
+# ✅ 새로 추가된 기록만 읽어 누적 통계를 갱신하는 증분 리더
+class RecordsTail:
+    def __init__(self, store, window=ROLLING_WINDOW):
+        self.store = store
+        self.window = window
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.cursor = None
+        self.games = 0
+        self.total_score = 0
+        self.total_success = 0
+        self.total_fail = 0
+        self.total_play_sec = 0
+        self.per_day = Counter()
+        self._recent = deque()
+        self._recent_sum = 0.0
+
+    def _add(self, row):
+        self.games += 1
+        self.total_score += row[_F["score"]]
+        self.total_success += row[_F["total_success"]]
+        self.total_fail += row[_F["total_fail"]]
+        self.total_play_sec += row[_F["duration_sec"]]
+        self.per_day[row[_F["played_at"]][:10]] += 1
+
+        # 힌트 없이 맞춘 SET이 있는 게임만 평균 시간 이동평균에 포함
+        if row[_F["no_hint_success"]]:
+            t = row[_F["avg_no_hint_time"]]
+            self._recent.append(t)
+            self._recent_sum += t
+            if len(self._recent) > self.window:
+                self._recent_sum -= self._recent.popleft()
+
+    # ✅ 마지막으로 읽은 위치 이후의 행만 반영 (삭제/잘림이 감지되면 처음부터)
+    def refresh(self):
+        with self._lock:
+            rows, cursor, reset = self.store.rows_since(self.cursor)
+            if reset:
+                self._reset()
+            for row in rows:
+                self._add(row)
+            self.cursor = cursor
+            return len(rows)
+
+    def rolling_no_hint_time(self):
+        if not self._recent:
+            return 0
+        return round(self._recent_sum / len(self._recent), 2)
+
+    def average_score(self):
+        return round(self.total_score / self.games, 2) if self.games else 0
+
+
+_tails = {}
+_tails_lock = threading.Lock()
+
+
+# ✅ 저장소별로 프로세스 전체에서 공유하는 리더
+def get_tail(store=None):
+    store = store or records_store.get_store()
+    key = (type(store).__name__, os.path.abspath(store.path))
+    with _tails_lock:
+        tail = _tails.get(key)
+        if tail is None:
+            tail = _tails[key] = RecordsTail(store)
+    tail.refresh()
+    return tail
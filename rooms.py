@@ -0,0 +1,172 @@
+import random
+import string
+import threading
+import time
+from collections import namedtuple
+
+import set_engine
+from game_core import BOARD_SIZE, Deck
+
+ROOM_TTL = 60 * 60
+MAX_PLAYERS = 8
+# 이 시간 동안 폴링/제출이 없는 플레이어는 방에서 뺀다 (탭을 닫았거나 연결이 끊긴 경우)
+PLAYER_TIMEOUT = 120
+
+# 클라이언트에 보내는 방 상태 (버전별로 한 번만 만든다)
+Snapshot = namedtuple("Snapshot", ["version", "cards", "scores", "last_event", "deck_remaining", "over"])
+
+
+# ✅ 여러 세션이 함께 쓰는 방 하나: 권위 있는 보드 + 플레이어 점수
+# 모든 변경은 방 잠금 안에서 하고, 바뀔 때마다 version을 올린다.
+# 클라이언트는 version만 비교해서 바뀌었을 때만 스냅샷을 받는다.
+class Room:
+    def __init__(self, room_id, seed=None):
+        self.id = room_id
+        self._lock = threading.Lock()
+        self.deck = Deck(random.Random(seed))
+        self.board = set_engine.Board(self.deck.draw(BOARD_SIZE))
+        self.players = {}
+        self.version = 0
+        self.last_event = None
+        self.touched = time.time()
+        self._fill()
+        self._snapshot = self._make_snapshot()
+
+    # SET이 없으면 3장씩 추가
+    def _fill(self):
+        while not self.board.has_set() and self.deck.remaining() >= 3:
+            self.board.extend(self.deck.draw(3))
+
+    def _make_snapshot(self):
+        return Snapshot(
+            self.version,
+            tuple(self.board.cards),
+            tuple(sorted(((name, s["success"], s["fail"]) for name, s in self.players.items()),
+                         key=lambda p: (-p[1], p[2], p[0]))),
+            self.last_event,
+            self.deck.remaining(),
+            self.is_over(),
+        )
+
+    def _changed(self, event):
+        self.version += 1
+        self.last_event = event
+        self.touched = time.time()
+        self._snapshot = self._make_snapshot()
+
+    def is_over(self):
+        return not self.board.has_set() and self.deck.remaining() < 3
+
+    # 잠금 안에서 호출: PLAYER_TIMEOUT 동안 소식이 없는 플레이어 정리
+    def _drop_stale(self, now):
+        for name in [n for n, s in self.players.items() if now - s["seen"] > PLAYER_TIMEOUT]:
+            del self.players[name]
+            self._changed(("leave", name))
+
+    # ✅ 입장: "ok" 입장, "name_taken" 이미 쓰는 닉네임, "full" 인원 초과
+    # 같은 토큰(같은 브라우저)으로 다시 들어오면 점수를 유지한 채 그대로 입장한다
+    def join(self, player, token=None):
+        with self._lock:
+            now = time.time()
+            self._drop_stale(now)
+            stats = self.players.get(player)
+            if stats is not None:
+                if token is None or stats["token"] != token:
+                    return "name_taken"
+                stats["seen"] = now
+                return "ok"
+            if len(self.players) >= MAX_PLAYERS:
+                return "full"
+            self.players[player] = {"success": 0, "fail": 0, "token": token, "seen": now}
+            self._changed(("join", player))
+            return "ok"
+
+    # ✅ 접속 확인: 폴링할 때마다 마지막 접속 시각을 갱신 (이미 빠진 플레이어면 False)
+    def heartbeat(self, player, token=None):
+        with self._lock:
+            now = time.time()
+            stats = self.players.get(player)
+            if stats is None or stats["token"] != token:
+                return False
+            stats["seen"] = now
+            self.touched = now
+            self._drop_stale(now)
+            return True
+
+    def leave(self, player):
+        with self._lock:
+            if self.players.pop(player, None) is not None:
+                self._changed(("leave", player))
+
+    # ✅ 버전 폴링: 바뀌지 않았으면 None (잠금 없이 정수 비교만)
+    def poll(self, since=None):
+        snapshot = self._snapshot
+        if since is not None and snapshot.version == since:
+            return None
+        return snapshot
+
+    # ✅ SET 제출: 카드 id 3장으로 선착순 판정
+    # "ok" 성공, "fail" SET 아님, "taken" 이미 다른 플레이어가 가져간 카드, "unknown" 참가하지 않은 플레이어
+    def claim(self, player, cards):
+        with self._lock:
+            stats = self.players.get(player)
+            if stats is None:
+                return "unknown"
+            stats["seen"] = time.time()
+            if len(set(cards)) != 3 or any(c not in self.board for c in cards):
+                return "taken"
+            if not set_engine.is_set_ids(*cards):
+                stats["fail"] += 1
+                self._changed(("fail", player, tuple(cards)))
+                return "fail"
+            stats["success"] += 1
+            indices = sorted(self.board.cards.index(c) for c in cards)
+            if len(self.board) == BOARD_SIZE and self.deck.remaining() >= 3:
+                self.board.replace(indices, self.deck.draw(3))
+            else:
+                for idx in reversed(indices):
+                    self.board.pop(idx)
+            self._fill()
+            self._changed(("ok", player, tuple(cards)))
+            return "ok"
+
+
+# ✅ 프로세스 전체 방 목록 (등록/조회만 짧게 잠그고, 그때 오래된 방을 정리한다)
+class RoomRegistry:
+    def __init__(self, ttl=ROOM_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rooms = {}
+
+    def create(self, seed=None):
+        with self._lock:
+            self._expire()
+            while True:
+                room_id = "".join(random.choices(string.ascii_uppercase + string.digits, k=5))
+                if room_id not in self._rooms:
+                    break
+            room = self._rooms[room_id] = Room(room_id, seed=seed)
+            return room
+
+    def get(self, room_id):
+        with self._lock:
+            self._expire()
+            return self._rooms.get(room_id)
+
+    def list(self):
+        with self._lock:
+            self._expire()
+            return list(self._rooms.values())
+
+    def remove(self, room_id):
+        with self._lock:
+            self._rooms.pop(room_id, None)
+
+    # 잠금 안에서 호출: 오래 사용하지 않은 방 정리
+    def _expire(self):
+        now = time.time()
+        for room_id in [r.id for r in self._rooms.values() if now - r.touched > self.ttl]:
+            del self._rooms[room_id]
+
+
+registry = RoomRegistry()
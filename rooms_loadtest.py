@@ -0,0 +1,100 @@
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+import perf
+import set_engine
+from rooms import RoomRegistry
+
+
+# ✅ 스크립트 클라이언트: 버전 폴링 → 생각 시간 → SET(가끔 실수) 제출
+def client(room, name, seed, args, stop, out):
+    rng = random.Random(seed)
+    room.join(name)
+    version = None
+    polls, claims, outcomes = [], [], Counter()
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        snapshot = room.poll(version)
+        polls.append(time.perf_counter() - t0)
+        if snapshot is None:
+            time.sleep(args.poll_ms / 1000)
+            continue
+        version = snapshot.version
+        if snapshot.over:
+            break
+        time.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+        sets = set_engine.find_sets(snapshot.cards)
+        if sets and rng.random() >= args.mistake_rate:
+            cards = [snapshot.cards[i] for i in rng.choice(sets)]
+        else:
+            cards = rng.sample(snapshot.cards, 3)
+        t0 = time.perf_counter()
+        outcomes[room.claim(name, cards)] += 1
+        claims.append(time.perf_counter() - t0)
+    out.append((polls, claims, outcomes))
+
+
+# 불변식: 덱 + 보드 + 가져간 카드 = 81장, 성공 수 = 가져간 SET 수
+def check_room(room):
+    taken = sum(s["success"] for s in room.players.values())
+    return room.deck.remaining() + len(room.board) + 3 * taken == set_engine.N_CARDS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="멀티플레이 방 부하 테스트 (로컬 스크립트 클라이언트)")
+    parser.add_argument("--rooms", type=int, default=24)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--duration", type=float, default=10.0, help="최대 실행 시간(초)")
+    parser.add_argument("--think-ms", type=float, default=20.0, help="평균 생각 시간")
+    parser.add_argument("--poll-ms", type=float, default=10.0, help="변경 없을 때 폴링 간격")
+    parser.add_argument("--mistake-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    registry = RoomRegistry()
+    rooms = [registry.create(seed=args.seed + i) for i in range(args.rooms)]
+    stop = threading.Event()
+    out = []
+    threads = [
+        threading.Thread(target=client, args=(room, f"bot{p}", args.seed * 1000 + r * 10 + p, args, stop, out))
+        for r, room in enumerate(rooms) for p in range(args.players)
+    ]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    deadline = t0 + args.duration
+    while time.perf_counter() < deadline and any(t.is_alive() for t in threads):
+        time.sleep(0.05)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    polls = [v for o in out for v in o[0]]
+    claims = [v for o in out for v in o[1]]
+    outcomes = sum((o[2] for o in out), Counter())
+    report = {
+        "rooms": args.rooms,
+        "players_per_room": args.players,
+        "elapsed_sec": round(elapsed, 2),
+        "polls": len(polls),
+        "polls_per_sec": round(len(polls) / elapsed),
+        "poll_latency": perf.latency_ms(polls, 4),
+        "claims": len(claims),
+        "claims_per_sec": round(len(claims) / elapsed),
+        "claim_latency": perf.latency_ms(claims, 4),
+        "outcomes": dict(outcomes),
+        "games_finished": sum(r.is_over() for r in rooms),
+        "invariants_ok": all(check_room(r) for r in rooms),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0 if report["invariants_ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
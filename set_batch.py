@@ -0,0 +1,135 @@
+import argparse
+import json
+import random
+import time
+from collections import namedtuple
+
+import numpy as np
+
+import set_engine
+
+# ✅ 세 번째 카드 테이블 (81 × 81, 평탄화) — set_engine.THIRD와 동일한 3진수 인코딩
+THIRD = np.frombuffer(set_engine.THIRD, dtype=np.uint8)
+
+BatchResult = namedtuple("BatchResult", ["counts", "has_set", "triples"])
+
+
+# ✅ 보드 묶음 (N, k) 판별: 보드별 SET 개수, SET 트리플 [보드 번호, i, j, k], SET 존재 여부
+def solve_batch(boards, chunk=100_000, with_triples=True):
+    boards = np.asarray(boards, dtype=np.int32)
+    n, k = boards.shape
+    pi, pj = np.triu_indices(k, 1)
+    slots = np.arange(k, dtype=np.int8)[None, :]
+    counts = np.zeros(n, dtype=np.int32)
+    triples = []
+    for start in range(0, n, chunk):
+        b = boards[start:start + chunk]
+        third = THIRD[b[:, pi] * set_engine.N_CARDS + b[:, pj]].astype(np.intp)
+        # 카드 id → 보드 위치 (없으면 -1)
+        pos = np.full((len(b), set_engine.N_CARDS), -1, dtype=np.int8)
+        np.put_along_axis(pos, b, slots, axis=1)
+        pk = np.take_along_axis(pos, third, axis=1)
+        hit = pk > pj
+        counts[start:start + len(b)] = np.count_nonzero(hit, axis=1)
+        if not with_triples:
+            continue
+        board_idx, pair_idx = np.nonzero(hit)
+        triples.append(np.stack([
+            board_idx + start, pi[pair_idx], pj[pair_idx], pk[board_idx, pair_idx],
+        ], axis=1))
+    triples = np.concatenate(triples) if triples else np.empty((0, 4), dtype=np.intp)
+    return BatchResult(counts, counts > 0, triples)
+
+
+# ✅ 81장 덱에서 k장 보드 N개를 무작위로 나눠 주기
+def deal_boards(rng, n, k):
+    keys = rng.random((n, set_engine.N_CARDS), dtype=np.float32)
+    return keys.argpartition(k, axis=1)[:, :k]
+
+
+def board_stats(n, k, seed=None, chunk=100_000):
+    rng = np.random.default_rng(seed)
+    hist = np.zeros(0, dtype=np.int64)
+    for start in range(0, n, chunk):
+        size = min(chunk, n - start)
+        counts = solve_batch(deal_boards(rng, size, k), chunk=chunk, with_triples=False).counts
+        c = np.bincount(counts)
+        if len(c) > len(hist):
+            hist = np.pad(hist, (0, len(c) - len(hist)))
+        hist[:len(c)] += c
+    return {
+        "boards": n,
+        "cards": k,
+        "p_no_set": float(hist[0] / n) if len(hist) else 0.0,
+        "mean_sets": float((np.arange(len(hist)) * hist).sum() / n),
+        "set_count_distribution": {str(i): int(v) for i, v in enumerate(hist) if v},
+    }
+
+
+# ✅ 게임 한 판 시뮬레이션: SET이 없으면 3장 추가한 횟수 반환
+def simulate_game(rng):
+    deck = list(range(set_engine.N_CARDS))
+    rng.shuffle(deck)
+    board, deck = deck[:12], deck[12:]
+    add3 = 0
+    while True:
+        combo = next(set_engine.iter_sets(board), None)
+        if combo is None:
+            if len(deck) < 3:
+                return add3
+            board.extend(deck[:3])
+            deck = deck[3:]
+            add3 += 1
+            continue
+        if len(board) == 12 and len(deck) >= 3:
+            for idx in combo:
+                board[idx] = deck.pop()
+        else:
+            for idx in sorted(combo, reverse=True):
+                board.pop(idx)
+
+
+def game_stats(n_games, seed=None):
+    rng = random.Random(seed)
+    events = [simulate_game(rng) for _ in range(n_games)]
+    hist = {}
+    for e in events:
+        hist[e] = hist.get(e, 0) + 1
+    return {
+        "games": n_games,
+        "expected_add3_per_game": sum(events) / n_games if n_games else 0.0,
+        "add3_distribution": {str(e): hist[e] for e in sorted(hist)},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SET 보드 몬테카를로 통계")
+    parser.add_argument("--boards", type=int, default=1_000_000, help="보드 크기별 시뮬레이션 보드 수")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[12, 15], help="보드 카드 수")
+    parser.add_argument("--games", type=int, default=10_000, help="3장 추가 횟수를 구할 게임 수")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = {"boards": [], "games": None}
+    t0 = time.perf_counter()
+    for k in args.sizes:
+        report["boards"].append(board_stats(args.boards, k, seed=args.seed))
+    report["games"] = game_stats(args.games, seed=args.seed)
+    report["elapsed_sec"] = round(time.perf_counter() - t0, 2)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    for stats in report["boards"]:
+        print(f"📊 {stats['cards']}장 보드 {stats['boards']:,}개")
+        print(f"  P(SET 없음) = {stats['p_no_set']:.5f}, 평균 SET 개수 = {stats['mean_sets']:.3f}")
+        for count, freq in stats["set_count_distribution"].items():
+            print(f"  SET {count}개: {freq / stats['boards']:.5f}")
+    games = report["games"]
+    print(f"🎲 게임 {games['games']:,}판: 게임당 평균 3장 추가 {games['expected_add3_per_game']:.3f}회")
+    print(f"⏱ {report['elapsed_sec']}초")
+
+
+if __name__ == "__main__":
+    main()
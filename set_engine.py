@@ -0,0 +1,258 @@
+from array import array
+from itertools import product
+
+# ✅ 카드 정수 인코딩
+# 카드 파일명 "abcd.png"의 네 자리(명암, 모양, 색깔, 개수)를 3진수로 읽어 0~80 정수 id로 사용한다.
+N_ATTRS = 4
+N_CARDS = 3 ** N_ATTRS
+
+ATTRS = [tuple(digits) for digits in product(range(3), repeat=N_ATTRS)]
+NAMES = ["".join(map(str, digits)) + ".png" for digits in ATTRS]
+NAME_TO_ID = {name: i for i, name in enumerate(NAMES)}
+
+
+def card_id(filename):
+    return NAME_TO_ID[filename[:4] + ".png"]
+
+
+def card_ids(filenames):
+    return [card_id(f) for f in filenames]
+
+
+def card_name(cid):
+    return NAMES[cid]
+
+
+def card_attrs(cid):
+    return list(ATTRS[cid])
+
+
+# ✅ 세 번째 카드 테이블: THIRD[a * 81 + b] = a, b와 SET을 이루는 유일한 카드
+def _third(a, b):
+    return sum(((-x - y) % 3) * 3 ** (N_ATTRS - 1 - i)
+               for i, (x, y) in enumerate(zip(ATTRS[a], ATTRS[b])))
+
+
+THIRD = bytes(_third(a, b) for a in range(N_CARDS) for b in range(N_CARDS))
+
+
+def third_card(a, b):
+    return THIRD[a * N_CARDS + b]
+
+
+def is_set_ids(a, b, c):
+    return a != b and THIRD[a * N_CARDS + b] == c
+
+
+# ✅ 자릿수 제한 없는 세 번째 카드: 3자리(27값)씩 끊어 작은 표(27×27)로 계산
+# id의 높은 자리가 0이면 결과의 그 자리도 0이므로 4속성 이하 카드에도 그대로 맞다.
+THIRD_27 = bytes(
+    sum(((-x - y) % 3) * 3 ** i for i, (x, y) in enumerate(zip(
+        (a % 3, a // 3 % 3, a // 9), (b % 3, b // 3 % 3, b // 9))))
+    for a in range(27) for b in range(27)
+)
+
+
+def third_card_wide(a, b):
+    result, scale = 0, 1
+    while a or b:
+        result += THIRD_27[a % 27 * 27 + b % 27] * scale
+        a //= 27
+        b //= 27
+        scale *= 27
+    return result
+
+
+# ✅ 보드(카드 id 리스트)에서 SET 찾기: O(n²) 테이블 조회 + 비트마스크 멤버십 검사
+def iter_sets(board):
+    pos = {}
+    mask = 0
+    for idx, cid in enumerate(board):
+        pos[cid] = idx
+        mask |= 1 << cid
+    n = len(board)
+    for i in range(n - 1):
+        row = board[i] * N_CARDS
+        for j in range(i + 1, n):
+            c = THIRD[row + board[j]]
+            if mask >> c & 1:
+                k = pos[c]
+                if k > j:
+                    yield (i, j, k)
+
+
+def find_sets(board):
+    return list(iter_sets(board))
+
+
+def has_set(board):
+    return next(iter_sets(board), None) is not None
+
+
+def count_sets(board):
+    return sum(1 for _ in iter_sets(board))
+
+
+# 고정되지 않은 속성 개수별 SET이 없는 보드의 최대 장수 (cap set 크기)
+MAX_SET_FREE = {1: 2, 2: 4, 3: 9, 4: 20, 5: 45, 6: 112}
+
+
+# ✅ 덱 변형: 속성 개수(4~6)와 고정 속성(주니어 덱)
+# 카드 id는 기본 덱과 같은 3진수 인코딩을 n자리로 늘린 것이고, 파일명도 n자리 숫자 + ".png"다.
+class Variant:
+    def __init__(self, key, label, n_attrs, board_size, max_board, fixed=None):
+        self.key = key
+        self.label = label
+        self.n_attrs = n_attrs
+        self.n_cards = 3 ** n_attrs
+        self.board_size = board_size
+        self.max_board = max_board
+        self.fixed = dict(fixed or {})
+        self.cards = tuple(
+            cid for cid in range(self.n_cards)
+            if all(self.attrs(cid)[i] == v for i, v in self.fixed.items())
+        )
+        self.typecode = "B" if self.n_cards <= 256 else "H"
+        # 81장 이하는 전체 표, 그보다 크면 27값 단위 계산
+        self.third = third_card if self.n_cards <= N_CARDS else third_card_wide
+
+    def __repr__(self):
+        return f"Variant({self.key!r})"
+
+    # 최대 장수에서 SET이 반드시 있는지 (그렇다면 덱을 다 쓰기 전에는 게임이 끝나지 않는다)
+    def always_finishes_deck(self):
+        return self.max_board > MAX_SET_FREE[self.n_attrs - len(self.fixed)]
+
+    def attrs(self, cid):
+        digits = []
+        for _ in range(self.n_attrs):
+            cid, d = divmod(cid, 3)
+            digits.append(d)
+        return digits[::-1]
+
+    def card_name(self, cid):
+        return "".join(map(str, self.attrs(cid))) + ".png"
+
+    def card_id(self, filename):
+        return int(filename[:self.n_attrs], 3)
+
+    def is_set_ids(self, a, b, c):
+        return a != b and self.third(a, b) == c
+
+    def iter_sets(self, board):
+        if self.third is third_card:
+            yield from iter_sets(board)
+            return
+        third = self.third
+        pos = {cid: idx for idx, cid in enumerate(board)}
+        n = len(board)
+        for i in range(n - 1):
+            a = board[i]
+            for j in range(i + 1, n):
+                k = pos.get(third(a, board[j]))
+                if k is not None and k > j:
+                    yield (i, j, k)
+
+    def find_sets(self, board):
+        return list(self.iter_sets(board))
+
+    def has_set(self, board):
+        return next(self.iter_sets(board), None) is not None
+
+    def count_sets(self, board):
+        return sum(1 for _ in self.iter_sets(board))
+
+
+# 기본 보드 장수와, SET이 없을 때 3장씩 늘릴 수 있는 최대 장수
+# 기본 덱은 원래 규칙(12장 → 최대 15장)을 유지하므로 SET 없이 덱이 남은 채 끝날 수 있다.
+# 변형 덱의 최대 장수는 SET이 없는 보드의 최대 크기(9·45·112장)보다 큰 3의 배수라서, 그 장수가 되면 SET이 반드시 있고
+# 게임은 덱이 바닥났을 때만 끝난다.
+# 5번째, 6번째 속성은 절차 생성 카드에서만 쓴다 (배경색, 테두리)
+VARIANTS = {
+    "standard": Variant("standard", "기본 (4속성 81장)", 4, 12, 15),
+    "junior": Variant("junior", "주니어 (색칠만 27장)", 4, 9, 12, fixed={0: 0}),
+    "five": Variant("five", "5속성 (243장)", 5, 15, 48),
+    "six": Variant("six", "6속성 (729장)", 6, 18, 114),
+}
+STANDARD = VARIANTS["standard"]
+
+
+# ✅ SET 목록을 증분으로 관리하는 보드
+# 카드를 넣거나 빼거나 바꿀 때 그 카드가 포함된 조합만 다시 확인하고,
+# 선택만 바뀌는 재실행에서는 저장된 SET 목록을 그대로 쓴다.
+class Board:
+    __slots__ = ("variant", "cards", "mask", "sets")
+
+    def __init__(self, cards=(), variant=None):
+        self.variant = variant or STANDARD
+        self.cards = array(self.variant.typecode)
+        self.mask = 0
+        self.sets = set()
+        self.extend(cards)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    # SET 목록을 다시 계산하지 않는 복사본
+    def copy(self):
+        other = Board(variant=self.variant)
+        other.cards = array(self.cards.typecode, self.cards)
+        other.mask = self.mask
+        other.sets = set(self.sets)
+        return other
+
+    def __getitem__(self, idx):
+        return self.cards[idx]
+
+    def __contains__(self, card):
+        return bool(self.mask >> card & 1)
+
+    # 새 카드가 보드의 두 카드와 이루는 SET 추가 (O(n))
+    def _link(self, card):
+        third = self.variant.third
+        mask = self.mask
+        for b in self.cards:
+            if mask >> b & 1:
+                c = third(card, b)
+                if c > b and mask >> c & 1:
+                    self.sets.add(tuple(sorted((card, b, c))))
+        self.mask |= 1 << card
+
+    def _unlink(self, card):
+        self.mask &= ~(1 << card)
+        self.sets = {s for s in self.sets if card not in s}
+
+    def append(self, card):
+        self.cards.append(card)
+        self._link(card)
+
+    def extend(self, cards):
+        for card in cards:
+            self.append(card)
+
+    # 여러 위치의 카드를 한 번에 교체 (기존 카드를 모두 빼고 새 카드를 연결)
+    def replace(self, indices, cards):
+        for idx in indices:
+            self._unlink(self.cards[idx])
+        for idx, card in zip(indices, cards):
+            self.cards[idx] = card
+            self._link(card)
+
+    def pop(self, idx):
+        card = self.cards.pop(idx)
+        self._unlink(card)
+        return card
+
+    def has_set(self):
+        return bool(self.sets)
+
+    def count_sets(self):
+        return len(self.sets)
+
+    # SET 목록을 보드 위치 (i, j, k)로
+    def find_sets(self):
+        index = {c: i for i, c in enumerate(self.cards)}
+        return sorted(tuple(sorted(index[c] for c in s)) for s in self.sets)
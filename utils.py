@@ -1,21 +1,35 @@
 import time
 import os
 import random
+import functools
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import pandas as pd
-import csv
 from datetime import datetime
 
+import set_engine
+import card_cache
+import records_store
+
 # 📁 카드 이미지 경로
 CARD_DIR = "set_cards"
 
 # ✅ 한글 폰트 설정 (NanumGothic)
-font_path = os.path.join("fonts", "NanumGothic-Regular.ttf")
-font_prop = fm.FontProperties(fname=font_path)
-plt.rcParams['font.family'] = font_prop.get_name()
-plt.rcParams['axes.unicode_minus'] = False
+# matplotlib은 차트를 그리는 페이지에서 처음 필요할 때 한 번만 불러온다 (게임 페이지 시작 속도)
+font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts", "NanumGothic-Regular.ttf")
+
+@functools.lru_cache(maxsize=None)
+def korean_font():
+    import matplotlib.font_manager as fm
+    fm.fontManager.addfont(font_path)
+    return fm.FontProperties(fname=font_path)
+
+# 전역 plt.rcParams를 바꾸지 않고 matplotlib.rc_context에 넘길 설정
+def korean_font_rc():
+    return {"font.family": korean_font().get_name(), "axes.unicode_minus": False}
+
+def __getattr__(name):
+    if name == "font_prop":
+        return korean_font()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ✅ 속성 매핑
 shading_map = {"0": "색칠", "1": "줄무늬", "2": "빈 것"}
@@ -41,7 +55,7 @@ def load_random_cards(n=12):
 
 # ✅ 카드 출력
 def display_card(filename):
-    st.image(os.path.join(CARD_DIR, filename), width=120)
+    st.image(card_cache.card_image(filename, 120), width=120)
     meta = decode(filename)
     st.markdown(f"**{meta['개수']} {meta['색깔']} {meta['명암']} {meta['모양']}**")
 
@@ -64,15 +78,17 @@ def check_answer(user_selections, correct, is_set, idx):
 
 # ✅ 카드 이름 → 속성값 리스트로 변환
 def parse_card_name(filename):
-    return [int(c) for c in filename[:4]]
+    return set_engine.card_attrs(set_engine.card_id(filename))
 
 # ✅ 세 카드가 SET인지 판별
+# 예전 동작 유지: 속성별 합이 3의 배수인지만 본다 (같은 카드 3장도 True)
+# 게임 판정은 서로 다른 카드만 인정하는 set_engine.is_set_ids를 쓴다
 def is_set(card1, card2, card3):
-    attrs = zip(parse_card_name(card1), parse_card_name(card2), parse_card_name(card3))
-    return all((a + b + c) % 3 == 0 for a, b, c in attrs)
+    a, b, c = set_engine.card_ids([card1, card2, card3])
+    return set_engine.third_card(a, b) == c
 
 # ✅ 게임 기록 저장 함수 (점수 = 힌트 없이 SET 맞춘 수 − 실패 수)
-def save_stats_summary(success_records, fail_records, duration_sec, file_path="game_records.csv"):
+def save_stats_summary(success_records, fail_records, duration_sec, store=None):
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # 힌트 여부 분리
@@ -100,16 +116,15 @@ def save_stats_summary(success_records, fail_records, duration_sec, file_path="g
     score = no_hint_success - total_fail
 
     # 저장
-    with open(file_path, mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            now,
-            no_hint_success,
-            avg_no_hint_time,
-            hint_success,
-            total_success,
-            total_fail,
-            avg_fail_time,
-            score,
-            duration_sec
-        ])
+    store = store or records_store.get_store()
+    store.insert([
+        now,
+        no_hint_success,
+        avg_no_hint_time,
+        hint_success,
+        total_success,
+        total_fail,
+        avg_fail_time,
+        score,
+        duration_sec
+    ])